@@ -3,14 +3,27 @@
 Build script for MOLE Documentation
 ----------------------------------
 This script handles SVG to PDF conversion and builds the LaTeX PDF documentation.
+
+The build is incremental: SVG files are only converted again when their
+content changed, Sphinx and LaTeX reuse the previous build directory, and
+pdflatex is rerun only until the .aux/.toc files stop changing. Pass
+--clean to start from an empty build directory.
 """
 
 import os
 import sys
+import json
+import hashlib
+import argparse
 import subprocess
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+IMAGES_DIR = Path('build/latex/_images')
+SVG_MANIFEST = IMAGES_DIR / '.svg-hashes.json'
+LATEX_DOC = 'MOLE-docs'
+
 def run_cmd(cmd, cwd=None):
     """Run a command and print its output in real-time."""
     print(f"\n=== Running: {cmd} ===")
@@ -41,85 +54,144 @@ def run_cmd(cmd, cwd=None):
         print(f"Error executing command: {e}")
         return False
 
-def convert_svg_files():
-    """Convert SVG files to PDFs using rsvg-convert."""
+def file_hash(path):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_svg_manifest():
+    """Load the content hashes of the previously converted SVG files."""
+    try:
+        with open(SVG_MANIFEST) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_svg_manifest(manifest):
+    """Store the content hashes of the converted SVG files."""
+    with open(SVG_MANIFEST, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+def convert_svg(svg_file, output_pdf):
+    """Convert a single SVG file to PDF, returning an error message or None."""
+    try:
+        # Use rsvg-convert for high-quality conversion
+        subprocess.run([
+            'rsvg-convert',
+            '-f', 'pdf',
+            '-o', str(output_pdf),
+            '--dpi-x', '600',
+            '--dpi-y', '600',
+            '--page-width', '2500',
+            '--page-height', '2000',
+            '--keep-aspect-ratio',
+            str(svg_file)
+        ], check=True, capture_output=True, text=True)
+    except subprocess.CalledProcessError as e:
+        return f"{e} {e.stderr.strip()}"
+    return None
+
+def convert_svg_files(jobs=None):
+    """Convert changed SVG files to PDFs using rsvg-convert in parallel."""
     if not shutil.which('rsvg-convert'):
         print("Error: rsvg-convert not found. Please install librsvg.")
         return False
     
     # Create output directory
-    os.makedirs('build/latex/_images', exist_ok=True)
+    IMAGES_DIR.mkdir(parents=True, exist_ok=True)
     
     # Find all SVG files
     svg_files = list(Path('source').rglob('*.svg'))
-    print(f"\nFound {len(svg_files)} SVG files to convert")
+    print(f"\nFound {len(svg_files)} SVG files")
     
+    manifest = load_svg_manifest()
+    hashes = {}
+    pending = []
     for svg_file in svg_files:
-        output_pdf = Path('build/latex/_images') / f"{svg_file.stem}.pdf"
-        print(f"\nConverting {svg_file} to {output_pdf}")
-        
-        try:
-            # Use rsvg-convert for high-quality conversion
-            subprocess.run([
-                'rsvg-convert',
-                '-f', 'pdf',
-                '-o', str(output_pdf),
-                '--dpi-x', '600',
-                '--dpi-y', '600',
-                '--page-width', '2500',
-                '--page-height', '2000',
-                '--keep-aspect-ratio',
-                str(svg_file)
-            ], check=True, capture_output=True, text=True)
-            
-            if output_pdf.exists() and output_pdf.stat().st_size > 1000:
-                print(f"✅ Success: Created PDF ({output_pdf.stat().st_size:,} bytes)")
-            else:
-                print(f"⚠️  Warning: PDF seems too small ({output_pdf.stat().st_size} bytes)")
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Error: {e}")
-            return False
+        output_pdf = IMAGES_DIR / f"{svg_file.stem}.pdf"
+        key = str(svg_file)
+        hashes[key] = file_hash(svg_file)
+        if manifest.get(key) != hashes[key] or not output_pdf.exists():
+            pending.append((svg_file, output_pdf))
     
-    return True
+    print(f"{len(pending)} SVG files changed since the last build")
+    
+    failed = False
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [(svg_file, output_pdf, pool.submit(convert_svg, svg_file, output_pdf))
+                       for svg_file, output_pdf in pending]
+            for svg_file, output_pdf, future in futures:
+                error = future.result()
+                if error:
+                    print(f"❌ Error converting {svg_file}: {error}")
+                    hashes.pop(str(svg_file))
+                    failed = True
+                elif output_pdf.stat().st_size > 1000:
+                    print(f"✅ Converted {svg_file} ({output_pdf.stat().st_size:,} bytes)")
+                else:
+                    print(f"⚠️  Warning: {output_pdf} seems too small ({output_pdf.stat().st_size} bytes)")
+    
+    save_svg_manifest(hashes)
+    return not failed
+
+def latex_state():
+    """Return the hashes of the auxiliary files that drive LaTeX reruns."""
+    state = {}
+    for ext in ('.aux', '.toc'):
+        path = f"{LATEX_DOC}{ext}"
+        state[ext] = file_hash(path) if os.path.exists(path) else None
+    return state
 
-def compile_latex():
-    """Compile LaTeX to PDF using pdflatex directly."""
+def compile_latex(max_passes=5):
+    """Compile LaTeX to PDF, rerunning pdflatex until references settle."""
     os.chdir('build/latex')
     
-    # Run pdflatex multiple times to resolve references
-    for i in range(3):
-        print(f"\n=== LaTeX Pass {i+1}/3 ===")
-        if not run_cmd('pdflatex -interaction=nonstopmode MOLE-docs.tex', cwd='.'):
+    # Rerun pdflatex only while the .aux/.toc files keep changing
+    previous = latex_state()
+    for i in range(max_passes):
+        print(f"\n=== LaTeX Pass {i+1} (at most {max_passes}) ===")
+        if not run_cmd(f'pdflatex -interaction=nonstopmode {LATEX_DOC}.tex', cwd='.'):
             print("LaTeX compilation failed")
             return False
+        current = latex_state()
+        if current == previous:
+            break
+        previous = current
+    else:
+        print(f"⚠️  Warning: references still changing after {max_passes} passes")
     
     # Check if PDF was generated
-    if os.path.exists('MOLE-docs.pdf'):
-        pdf_size = os.path.getsize('MOLE-docs.pdf')
+    if os.path.exists(f'{LATEX_DOC}.pdf'):
+        pdf_size = os.path.getsize(f'{LATEX_DOC}.pdf')
         print(f"\n✅ PDF generated successfully ({pdf_size:,} bytes)")
-        print(f"Location: {os.path.abspath('MOLE-docs.pdf')}")
+        print(f"Location: {os.path.abspath(f'{LATEX_DOC}.pdf')}")
         return True
     else:
         print("\n❌ PDF generation failed")
         return False
 
-def build_pdf():
+def build_pdf(clean=False, jobs=None):
     """Build the PDF documentation."""
     print("\n=== Building PDF documentation ===")
     
-    # Clean build directory
-    if os.path.exists('build'):
+    # Clean build directory only on request, otherwise build incrementally
+    if clean and os.path.exists('build'):
         print("Cleaning build directory...")
         shutil.rmtree('build')
     
     # Convert SVG files first
-    if not convert_svg_files():
+    if not convert_svg_files(jobs):
         print("\n❌ SVG conversion failed")
         return False
     
     # Build LaTeX
     print("\n=== Generating LaTeX files ===")
-    if not run_cmd('sphinx-build -b latex source build/latex'):
+    sphinx_jobs = jobs if jobs else 'auto'
+    if not run_cmd(f'sphinx-build -j {sphinx_jobs} -b latex source build/latex'):
         print("\n❌ LaTeX generation failed")
         return False
     
@@ -132,5 +204,11 @@ def build_pdf():
     return True
 
 if __name__ == '__main__':
-    if not build_pdf():
-        sys.exit(1) 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Build the MOLE PDF documentation.")
+    parser.add_argument('--clean', action='store_true',
+                        help="remove the build directory before building")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="number of parallel workers (default: all cores)")
+    args = parser.parse_args()
+    if not build_pdf(clean=args.clean, jobs=args.jobs):
+        sys.exit(1) 
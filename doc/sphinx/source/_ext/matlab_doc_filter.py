@@ -1,20 +1,53 @@
 """
 Sphinx extension to filter out license headers from MATLAB docstrings
 and format them in an M2HTML-like style.
+
+The call graph and the function descriptions are stored on the build
+environment rather than in module globals, so that parallel reads
+(``sphinx-build -j``) share a single analysis done in the main process
+and incremental builds reuse it until the MATLAB sources change.
 """
 import re
 import os
 import glob
 
-# Cache for function descriptions
-_function_descriptions = {}
 
-# Graph of function calls (which functions call which)
-_function_calls_graph = {}
-# Graph of function dependencies (which functions are called by which)
-_function_dependency_graph = {}
-# Flag to track if we've analyzed the code
-_analyzed_code = False
+def _matlab_src_signature(matlab_src_dir):
+    """
+    Build a cheap signature of the MATLAB sources (file names and mtimes).
+
+    Args:
+        matlab_src_dir: Directory containing MATLAB source files
+
+    Returns:
+        A sorted tuple of (filename, mtime) pairs
+    """
+    signature = []
+    for filepath in glob.glob(os.path.join(matlab_src_dir, "*.m")):
+        try:
+            signature.append((os.path.basename(filepath), os.path.getmtime(filepath)))
+        except OSError:
+            continue
+    return tuple(sorted(signature))
+
+
+def _extract_description(content):
+    """
+    Extract the first comment line of a MATLAB file as its description.
+
+    Args:
+        content: The text of the MATLAB file
+
+    Returns:
+        The first line description if found, empty string otherwise
+    """
+    for line in content.splitlines():
+        if line.strip().startswith('%'):
+            description = line.strip()[1:].strip()
+            # Clean up the description by removing dash sequences
+            return re.sub(r'-{5,}', '', description).strip()
+    return ""
+
 
 def analyze_matlab_code(matlab_src_dir):
     """
@@ -22,20 +55,20 @@ def analyze_matlab_code(matlab_src_dir):
     
     This function parses all MATLAB files in the source directory to identify
     function calls and builds call graphs for both directions (calls and called by).
+    The first comment line of every file is collected at the same time so that
+    descriptions never need to be read again while documents are processed.
     
     Args:
         matlab_src_dir: Directory containing MATLAB source files
+
+    Returns:
+        A tuple (calls_graph, dependency_graph, descriptions)
     """
-    global _function_calls_graph, _function_dependency_graph, _analyzed_code
-    
-    if _analyzed_code:
-        return  # Only analyze once
-    
     print(f"Analyzing MATLAB code in {matlab_src_dir}")
     
-    # Reset graphs
-    _function_calls_graph = {}
-    _function_dependency_graph = {}
+    function_calls_graph = {}
+    function_dependency_graph = {}
+    function_descriptions = {}
     
     # Get all MATLAB files
     matlab_files = glob.glob(os.path.join(matlab_src_dir, "*.m"))
@@ -51,8 +84,8 @@ def analyze_matlab_code(matlab_src_dir):
         case_map[function_name.lower()] = function_name
         function_names.append(function_name.lower())  # Store lowercase for case-insensitive matching
         # Store keys in the graphs using original case
-        _function_calls_graph[function_name] = set()
-        _function_dependency_graph[function_name] = set()
+        function_calls_graph[function_name] = set()
+        function_dependency_graph[function_name] = set()
     
     # Second pass: analyze function calls
     for filepath in matlab_files:
@@ -62,8 +95,7 @@ def analyze_matlab_code(matlab_src_dir):
             with open(filepath, 'r') as f:
                 content = f.read()
             
-            # DEBUG: Print the file being analyzed
-            # print(f"Analyzing file: {os.path.basename(filepath)}")
+            function_descriptions[function_name] = _extract_description(content)
             
             # Look for function calls
             for other_func_lower in function_names:
@@ -76,87 +108,102 @@ def analyze_matlab_code(matlab_src_dir):
                         other_func = case_map[other_func_lower]
                         
                         # This function calls other_func
-                        _function_calls_graph[function_name].add(other_func)
-                        # Debug: Log the function call detection
-                        # print(f"  FOUND: {function_name} calls {other_func}")
+                        function_calls_graph[function_name].add(other_func)
                         
                         # other_func is called by this function
-                        _function_dependency_graph[other_func].add(function_name)
+                        function_dependency_graph[other_func].add(function_name)
                         
         except Exception as e:
             print(f"Error analyzing {filepath}: {e}")
     
     # Print some stats for debugging
     print(f"Analyzed {len(matlab_files)} MATLAB files")
-    total_calls = sum(len(calls) for calls in _function_calls_graph.values())
+    total_calls = sum(len(calls) for calls in function_calls_graph.values())
     print(f"Found {total_calls} function calls")
     
-    # DEBUG: Print both graphs for comparison
-    # print("\nFUNCTION CALLS GRAPH (functions that call others):")
-    # for func, calls in _function_calls_graph.items():
-    #     if calls:  # Only print non-empty entries
-    #         print(f"{func} calls: {', '.join(calls)}")
-    # 
-    # print("\nFUNCTION DEPENDENCY GRAPH (functions called by others):")
-    # for func, called_by in _function_dependency_graph.items():
-    #     if called_by:  # Only print non-empty entries
-    #         print(f"{func} is called by: {', '.join(called_by)}")
-    
-    _analyzed_code = True
+    return function_calls_graph, function_dependency_graph, function_descriptions
 
-def get_function_description(func_name, matlab_src_dir):
+def get_function_description(func_name, env):
     """
     Get the first line description of a MATLAB function.
     
     Args:
         func_name: The name of the function
-        matlab_src_dir: The directory containing MATLAB source files
+        env: The Sphinx build environment holding the analysis results
         
     Returns:
         The first line description if found, empty string otherwise
     """
-    if func_name in _function_descriptions:
-        return _function_descriptions[func_name]
+    descriptions = getattr(env, 'matlab_function_descriptions', {})
+    
+    # Remove .m extension if present
+    if func_name.endswith('.m'):
+        func_name = func_name[:-2]
+    
+    if func_name in descriptions:
+        return descriptions[func_name]
     
-    # Add .m extension if not present
-    if not func_name.endswith('.m'):
-        func_file = f"{func_name}.m"
-    else:
-        func_file = func_name
-        func_name = func_name[:-2]  # Remove .m
+    # Fall back to a case-insensitive lookup
+    for name, description in descriptions.items():
+        if name.lower() == func_name.lower():
+            return description
+    
+    return ""
 
-    # Look for the file in the MATLAB source directory
-    filepath = os.path.join(matlab_src_dir, func_file)
-    if not os.path.exists(filepath):
-        # Try finding it with case-insensitive search
-        all_files = glob.glob(os.path.join(matlab_src_dir, "*.m"))
-        for file in all_files:
-            if os.path.basename(file).lower() == func_file.lower():
-                filepath = file
-                break
-        else:
-            _function_descriptions[func_name] = ""
-            return ""
+def init_matlab_analysis(app, env, docnames):
+    """
+    Analyze the MATLAB sources before any document is read.
+    
+    Connected to ``env-before-read-docs``, which runs in the main process
+    before Sphinx forks its parallel readers, so every reader inherits the
+    results through the pickled environment. The analysis is redone only
+    when the MATLAB sources changed since the previous build, in which case
+    the documents that rendered MATLAB docstrings are scheduled for rereading.
+    """
+    matlab_src_dir = getattr(app.config, 'matlab_src_dir', '')
+    if not matlab_src_dir:
+        return
+    
+    if not hasattr(env, 'matlab_documented_functions'):
+        env.matlab_documented_functions = {}
+    
+    signature = _matlab_src_signature(matlab_src_dir)
+    if getattr(env, 'matlab_src_signature', None) == signature:
+        return
+    
+    (env.matlab_function_calls_graph,
+     env.matlab_function_dependency_graph,
+     env.matlab_function_descriptions) = analyze_matlab_code(matlab_src_dir)
+    env.matlab_src_signature = signature
+    
+    # Cross-references may have changed for every page that shows them
+    for docname in env.matlab_documented_functions:
+        if docname in env.found_docs and docname not in docnames:
+            docnames.append(docname)
 
-    # Read the file and extract the first comment line as the description
-    try:
-        with open(filepath, 'r') as f:
-            lines = f.readlines()
-            
-        # Skip the function declaration line
-        for i, line in enumerate(lines):
-            if line.strip().startswith('%'):
-                # Found the first comment line
-                description = line.strip()[1:].strip()
-                # Clean up the description by removing dash sequences
-                description = re.sub(r'-{5,}', '', description).strip()
-                _function_descriptions[func_name] = description
-                return description
-    except Exception as e:
-        print(f"Error reading function description for {func_name}: {e}")
+def purge_matlab_doc(app, env, docname):
+    """Forget which MATLAB functions a document rendered."""
+    if hasattr(env, 'matlab_documented_functions'):
+        env.matlab_documented_functions.pop(docname, None)
+
+def merge_matlab_info(app, env, docnames, other):
+    """Merge the per-document records of a parallel reader into the main environment."""
+    if not hasattr(env, 'matlab_documented_functions'):
+        env.matlab_documented_functions = {}
     
-    _function_descriptions[func_name] = ""
-    return ""
+    other_documented = getattr(other, 'matlab_documented_functions', {})
+    for docname in docnames:
+        if docname in other_documented:
+            env.matlab_documented_functions[docname] = other_documented[docname]
+    
+    # The analysis is done before the fork, but keep the main environment
+    # complete should a reader ever have produced it on its own
+    for attr in ('matlab_src_signature',
+                 'matlab_function_calls_graph',
+                 'matlab_function_dependency_graph',
+                 'matlab_function_descriptions'):
+        if not hasattr(env, attr) and hasattr(other, attr):
+            setattr(env, attr, getattr(other, attr))
 
 def m2html_style_formatter(app, what, name, obj, options, lines):
     """
@@ -176,12 +223,15 @@ def m2html_style_formatter(app, what, name, obj, options, lines):
     remove_license = matlab_filter_options.get('remove_license', True)
     m2html_style = matlab_filter_options.get('m2html_style', True)
     
-    # Get MATLAB source directory from configuration
-    matlab_src_dir = getattr(app.config, 'matlab_src_dir', '')
+    # Call graphs are built once per build by init_matlab_analysis
+    env = app.env
+    function_calls_graph = getattr(env, 'matlab_function_calls_graph', {})
+    function_dependency_graph = getattr(env, 'matlab_function_dependency_graph', {})
     
-    # Analyze the MATLAB code to build call graphs
-    if matlab_src_dir and not _analyzed_code:
-        analyze_matlab_code(matlab_src_dir)
+    # Remember which functions this document renders, see purge_matlab_doc
+    docname = env.temp_data.get('docname')
+    if docname and hasattr(env, 'matlab_documented_functions'):
+        env.matlab_documented_functions.setdefault(docname, set()).add(name)
     
     # Store the original first line description as the PURPOSE
     first_desc_line = ""
@@ -240,17 +290,17 @@ def m2html_style_formatter(app, what, name, obj, options, lines):
         # For case-insensitivity, try to find a matching function name irrespective of case
         calls_functions = []
         found_in_calls_graph = False
-        for func_name in _function_calls_graph:
+        for func_name in function_calls_graph:
             if func_name.lower() == function_base_name.lower():
-                calls_functions = list(_function_calls_graph[func_name])
+                calls_functions = sorted(function_calls_graph[func_name])
                 found_in_calls_graph = True
                 break
         
         called_by = []
         found_in_dependency_graph = False
-        for func_name in _function_dependency_graph:
+        for func_name in function_dependency_graph:
             if func_name.lower() == function_base_name.lower():
-                called_by = list(_function_dependency_graph[func_name])
+                called_by = sorted(function_dependency_graph[func_name])
                 found_in_dependency_graph = True
                 break
         
@@ -347,7 +397,7 @@ def m2html_style_formatter(app, what, name, obj, options, lines):
                 for i, func in enumerate(calls_functions):
                     # Get description for the function
                     func_name = func.strip().split()[0] if func.strip() else func
-                    desc = get_function_description(func_name, matlab_src_dir)
+                    desc = get_function_description(func_name, env)
                     
                     # Clean up the description to remove dash sequences
                     if desc:
@@ -372,7 +422,7 @@ def m2html_style_formatter(app, what, name, obj, options, lines):
                 for i, func in enumerate(called_by):
                     # Get description for the function
                     func_name = func.strip().split()[0] if func.strip() else func
-                    desc = get_function_description(func_name, matlab_src_dir)
+                    desc = get_function_description(func_name, env)
                     
                     # Clean up the description to remove dash sequences
                     if desc:
@@ -411,8 +461,14 @@ def setup(app):
     # Connect to the autodoc-process-docstring event
     app.connect('autodoc-process-docstring', m2html_style_formatter)
     
+    # Keep the analysis on the environment so parallel reads can share it
+    app.connect('env-before-read-docs', init_matlab_analysis)
+    app.connect('env-purge-doc', purge_matlab_doc)
+    app.connect('env-merge-info', merge_matlab_info)
+    
     return {
-        'version': '0.1',
+        'version': '0.2',
+        'env_version': 1,
         'parallel_read_safe': True,
         'parallel_write_safe': True,
     } 
\ No newline at end of file
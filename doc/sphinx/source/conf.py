@@ -13,6 +13,9 @@ import subprocess
 import importlib.util
 import pkg_resources
 import glob
+import hashlib
+import fnmatch
+import filecmp
 
 #------------------------------------------------------------------------------
 # Path configuration
@@ -115,10 +118,74 @@ breathe_domain_by_extension = {
 }
 breathe_default_members = ('members', 'undoc-members')
 
-# Run Doxygen if needed during build
-if not os.path.exists(str(ROOT_DIR / "doc/doxygen/cpp/xml/index.xml")):
+def hash_files(paths):
+    """Return a SHA-256 digest over the names and contents of the given files."""
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(os.path.relpath(path, str(ROOT_DIR)).encode())
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def doxyfile_tags(path):
+    """Return the tags of a Doxyfile as a dict of value lists."""
+    tags = {}
+    key = None
+    with open(path) as f:
+        for line in f:
+            line = line.split('#', 1)[0].rstrip()
+            if not line:
+                key = None
+                continue
+            if key is None:
+                if '=' not in line:
+                    continue
+                key, _, line = line.partition('=')
+                key = key.strip().rstrip('+')
+                tags.setdefault(key, [])
+            continued = line.endswith('\\')
+            tags[key] += line.rstrip('\\').split()
+            if not continued:
+                key = None
+    return tags
+
+def doxygen_input_files(doxyfile):
+    """Return the files Doxygen parses, following INPUT, FILE_PATTERNS,
+    RECURSIVE and EXCLUDE_PATTERNS of the Doxyfile."""
+    tags = doxyfile_tags(doxyfile)
+    patterns = tags.get('FILE_PATTERNS') or ['*']
+    excludes = tags.get('EXCLUDE_PATTERNS', [])
+    recursive = tags.get('RECURSIVE', ['NO'])[0] == 'YES'
+    files = []
+    for entry in tags.get('INPUT', []):
+        path = ROOT_DIR / entry
+        if path.is_file():
+            files.append(str(path))
+            continue
+        for pattern in patterns:
+            files += glob.glob(str(path / ('**' if recursive else '') / pattern),
+                               recursive=recursive)
+    return [f for f in set(files)
+            if not any(fnmatch.fnmatch(f, p) for p in excludes)]
+
+# Run Doxygen only when one of its input files or the Doxyfile changed
+doxygen_xml_index = ROOT_DIR / "doc/doxygen/cpp/xml/index.xml"
+# Kept out of doc/doxygen, which html_extra_path copies into the HTML
+doxygen_stamp = ROOT_DIR / "doc/sphinx/.doxygen-input.sha256"
+doxyfile = ROOT_DIR / "Doxyfile"
+doxygen_hash = hash_files([str(doxyfile)] + doxygen_input_files(doxyfile))
+
+if not doxygen_xml_index.exists():
     print("Doxygen XML not found. Running Doxygen...")
-    subprocess.call(["doxygen", "Doxyfile"], cwd=str(ROOT_DIR))
+    run_doxygen = True
+elif not doxygen_stamp.exists() or doxygen_stamp.read_text().strip() != doxygen_hash:
+    print("Doxygen inputs changed since the last Doxygen run. Running Doxygen...")
+    run_doxygen = True
+else:
+    run_doxygen = False
+
+if run_doxygen and subprocess.call(["doxygen", "Doxyfile"], cwd=str(ROOT_DIR)) == 0:
+    doxygen_stamp.write_text(doxygen_hash + "\n")
 
 #------------------------------------------------------------------------------
 # GraphViz configuration
@@ -320,13 +387,23 @@ def mkdir_p(path):
     except FileExistsError:
         pass
 
-# Clean up and copy example documentation from source tree
+def sync_file(src, destdir):
+    """Copy src into destdir unless an identical file is already there.
+
+    Unchanged files keep their modification time, so Sphinx does not treat
+    the pages that use them as outdated.
+    """
+    mkdir_p(destdir)
+    dest_file = os.path.join(destdir, os.path.basename(src))
+    if os.path.exists(dest_file) and filecmp.cmp(src, dest_file, shallow=False):
+        return dest_file
+    shutil.copy2(src, destdir)
+    print(f"DEBUG: Copied file: {src} to {destdir}")
+    return dest_file
+
+# Synchronize example documentation from source tree
 example_dest = str(ROOT_DIR / "doc/sphinx/source/examples")
-try:
-    if os.path.exists(example_dest):
-        shutil.rmtree(example_dest)
-except FileNotFoundError:
-    pass
+synced_files = set()
 
 # Debug info
 print("\nDEBUG: Exclude Patterns:")
@@ -337,24 +414,19 @@ for pattern in exclude_patterns:
 for filename in glob.glob(str(ROOT_DIR / "examples/**/*.md"), recursive=True):
     rel_path = os.path.relpath(filename, str(ROOT_DIR / "examples"))
     destdir = os.path.join(example_dest, os.path.dirname(rel_path))
-    dest_file = os.path.join(destdir, os.path.basename(rel_path))
     
     # Only exclude if the relative path exactly matches an exclude pattern
     skip_file = rel_path in exclude_patterns
     
     if not skip_file:
-        mkdir_p(destdir)
-        shutil.copy2(filename, destdir)
-        print(f"DEBUG: Copied markdown file: {filename} to {destdir}")
+        synced_files.add(sync_file(filename, destdir))
 
 # Copy all image files from examples directory
 for ext in ['*.jpg', '*.jpeg', '*.png', '*.svg']:
     for filename in glob.glob(str(ROOT_DIR / "examples/**/" / ext), recursive=True):
         rel_path = os.path.relpath(filename, str(ROOT_DIR / "examples"))
         destdir = os.path.join(example_dest, os.path.dirname(rel_path))
-        mkdir_p(destdir)
-        shutil.copy2(filename, destdir)
-        print(f"DEBUG: Copied image file: {filename} to {destdir}")
+        synced_files.add(sync_file(filename, destdir))
 
 # Debug info to help troubleshoot file copying
 print("\nDEBUG: Directory Structure Before File Operations:")
@@ -375,6 +447,15 @@ readme_files = [
     os.path.join(example_dest, "matlab/compact_operators/README.md")
 ]
 
+# Remove copies whose source no longer exists in the examples directory
+if os.path.exists(example_dest):
+    for root, dirs, files in os.walk(example_dest):
+        for file in files:
+            dest_file = os.path.join(root, file)
+            if dest_file not in synced_files and dest_file not in readme_files:
+                os.remove(dest_file)
+                print(f"DEBUG: Removed stale file: {dest_file}")
+
 for readme_file in readme_files:
     dir_path = os.path.dirname(readme_file)
     if not os.path.exists(dir_path):
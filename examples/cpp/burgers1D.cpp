@@ -0,0 +1,64 @@
+/**
+ * This example uses MOLE and the Jacobian-free Newton-Krylov solver to
+ * solve the 1D viscous Burgers' equation, u_t + (u^2 / 2)_x = nu * u_xx,
+ * with backward Euler steps ten times larger than the explicit CFL limit.
+ * Initial Condition: exp(-x^2/50)
+ */
+
+#include "mole.h"
+#include <iostream>
+
+int main() {
+
+  int k = 2;                   // Operators' order of accuracy
+  Real west = -15;             // Domain's limits
+  Real east = 15;
+  int m = 300;                 // Number of cells
+  Real dx = (east - west) / m; // Cell's width
+  Real nu = 0.01;              // Viscosity
+  Real t = 10;                 // Simulation time
+  Real dt = 10 * dx;           // Ten times the explicit CFL condition
+  int steps = t / dt;          // Number of time steps
+
+  // Get 1D mimetic operators
+  Divergence D(k, m, dx);
+  Interpol I(m, 1); // Upwind, the fluid propagates to the right
+  Laplacian L(k, m, dx);
+
+  // 1D Staggered grid
+  vec xgrid(m + 2);
+  xgrid(0) = west;
+  xgrid.subvec(1, m) = linspace(west + dx / 2, east - dx / 2, m);
+  xgrid(m + 1) = east;
+
+  // Impose IC
+  vec U = exp(-square(xgrid) / 50);
+  vec U_old = U;
+
+  // The boundary rows of D and L are zero, so the boundary values are kept
+  sp_mat DI = (sp_mat)D * (sp_mat)I;
+  auto F = [&](const vec &u) -> vec {
+    return u - U_old + dt * (DI * (0.5 * square(u)) - nu * (L * u));
+  };
+
+  // The linear diffusion part preconditions the Jacobian of F
+  sp_mat P = speye(m + 2, m + 2) - dt * nu * (sp_mat)L;
+  NewtonKrylov solver(F, P);
+
+  // Time integration loop
+  for (int i = 1; i <= steps; i++) {
+    U_old = U;
+    if (!solver.solve(U)) {
+      std::cerr << "Newton-Krylov did not converge at step " << i << "\n";
+      return 1;
+    }
+
+    // Check for area conservation
+    std::cout << "t = " << i * dt << ", Newton iterations = "
+              << solver.iterations
+              << ", GMRES iterations = " << solver.linear_iterations
+              << ", area = " << as_scalar(trapz(xgrid, U)) << "\n";
+  }
+
+  return 0;
+}
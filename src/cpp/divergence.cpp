@@ -14,6 +14,7 @@
  */
 
 #include "divergence.h"
+#include "gradient.h"
 
 // 1-D Constructor
 Divergence::Divergence(u16 k, u32 m, Real dx) : sp_mat(m + 2, m + 1) {
@@ -108,9 +109,6 @@ Divergence::Divergence(u16 k, u32 m, Real dx) : sp_mat(m + 2, m + 1) {
 
 // 2-D Constructor
 Divergence::Divergence(u16 k, u32 m, u32 n, Real dx, Real dy) {
-  Divergence Dx(k, m, dx);
-  Divergence Dy(k, n, dy);
-
   sp_mat Im = speye(m + 2, m + 2);
   sp_mat In = speye(n + 2, n + 2);
 
@@ -119,8 +117,12 @@ Divergence::Divergence(u16 k, u32 m, u32 n, Real dx, Real dy) {
   In.shed_col(0);
   In.shed_col(n);
 
-  sp_mat D1 = Utils::spkron(In, Dx);
-  sp_mat D2 = Utils::spkron(Dy, Im);
+  // The blocks are independent, each task builds its own 1-D operator
+  sp_mat D1, D2;
+  Utils::run_tasks({
+      [&] { D1 = Utils::spkron(In, Divergence(k, m, dx)); },
+      [&] { D2 = Utils::spkron(Divergence(k, n, dy), Im); },
+  });
 
   // Dimensions = (m+2)*(n+2), 2*m*n+m+n
   if (m != n)
@@ -135,10 +137,6 @@ Divergence::Divergence(u16 k, u32 m, u32 n, Real dx, Real dy) {
 
 // 3-D Constructor
 Divergence::Divergence(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz) {
-  Divergence Dx(k, m, dx);
-  Divergence Dy(k, n, dy);
-  Divergence Dz(k, o, dz);
-
   sp_mat Im = speye(m + 2, m + 2);
   sp_mat In = speye(n + 2, n + 2);
   sp_mat Io = speye(o + 2, o + 2);
@@ -150,9 +148,13 @@ Divergence::Divergence(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz) {
   Io.shed_col(0);
   Io.shed_col(o);
 
-  sp_mat D1 = Utils::spkron(Utils::spkron(Io, In), Dx);
-  sp_mat D2 = Utils::spkron(Utils::spkron(Io, Dy), Im);
-  sp_mat D3 = Utils::spkron(Utils::spkron(Dz, In), Im);
+  // The blocks are independent, each task builds its own 1-D operator
+  sp_mat D1, D2, D3;
+  Utils::run_tasks({
+      [&] { D1 = Utils::spkron(Utils::spkron(Io, In), Divergence(k, m, dx)); },
+      [&] { D2 = Utils::spkron(Utils::spkron(Io, Divergence(k, n, dy)), Im); },
+      [&] { D3 = Utils::spkron(Utils::spkron(Divergence(k, o, dz), In), Im); },
+  });
 
   // Dimensions = (m+2)*(n+2)*(o+2), 3*m*n*o+m*n+m*o+n*o
   if ((m != n) || (n != o))
@@ -167,5 +169,68 @@ Divergence::Divergence(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz) {
   }
 }
 
+// 1-D Periodic Constructor
+Divergence::Divergence(u16 k, u32 m, Real dx, Periodic periodic) {
+  if (!periodic.x) {
+    *this = Divergence(k, m, dx);
+    return;
+  }
+
+  // The interior stencils are antisymmetric, so D = -G' without a boundary
+  Gradient G(k, m, dx, Periodic{true});
+
+  // Dimensions = m, m
+  *this = -sp_mat(G.t());
+
+  // Uniform weights, there is no boundary
+  Q = ones<vec>(m);
+}
+
+// 2-D Constructor, periodic along some directions
+Divergence::Divergence(u16 k, u32 m, u32 n, Real dx, Real dy,
+                       Periodic periodic) {
+  // The transposes of the Gradient's, cells to the points of a direction
+  const sp_mat Im = Utils::face_cells(m, periodic.x).t();
+  const sp_mat In = Utils::face_cells(n, periodic.y).t();
+
+  sp_mat D1, D2;
+  Utils::run_tasks({
+      [&] {
+        D1 = Utils::spkron(In, Divergence(k, m, dx, Periodic{periodic.x}));
+      },
+      [&] {
+        D2 = Utils::spkron(Divergence(k, n, dy, Periodic{periodic.y}), Im);
+      },
+  });
+
+  *this = Utils::spjoin_rows(D1, D2);
+}
+
+// 3-D Constructor, periodic along some directions
+Divergence::Divergence(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz,
+                       Periodic periodic) {
+  const sp_mat Im = Utils::face_cells(m, periodic.x).t();
+  const sp_mat In = Utils::face_cells(n, periodic.y).t();
+  const sp_mat Io = Utils::face_cells(o, periodic.z).t();
+
+  sp_mat D1, D2, D3;
+  Utils::run_tasks({
+      [&] {
+        D1 = Utils::spkron(Utils::spkron(Io, In),
+                           Divergence(k, m, dx, Periodic{periodic.x}));
+      },
+      [&] {
+        D2 = Utils::spkron(
+            Utils::spkron(Io, Divergence(k, n, dy, Periodic{periodic.y})), Im);
+      },
+      [&] {
+        D3 = Utils::spkron(
+            Utils::spkron(Divergence(k, o, dz, Periodic{periodic.z}), In), Im);
+      },
+  });
+
+  *this = Utils::spjoin_rows(Utils::spjoin_rows(D1, D2), D3);
+}
+
 // Returns weights
 vec Divergence::getQ() { return Q; }
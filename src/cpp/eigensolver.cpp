@@ -0,0 +1,219 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
+*/
+
+/*
+ * @file eigensolver.cpp
+ *
+ * @brief Sparse shift-invert eigensolver for mimetic operators
+ *
+ * @date 2026/10/19
+ */
+
+#include "eigensolver.h"
+#include <algorithm>
+#include <cassert>
+#include <limits>
+#include <stdexcept>
+
+Eigensolver::Eigensolver(const sp_mat &A)
+    : A(A), has_mass(false), lu_sigma(0.0), lu_shifted(false) {
+  assert(A.n_rows == A.n_cols);
+}
+
+Eigensolver::Eigensolver(const sp_mat &A, const sp_mat &M)
+    : A(A), M(M), has_mass(true), lu_sigma(0.0), lu_shifted(false) {
+  assert(A.n_rows == A.n_cols);
+  assert(M.n_rows == A.n_rows && M.n_cols == A.n_cols);
+}
+
+Eigensolver::Eigensolver(const sp_mat &A, const vec &weights)
+    : Eigensolver(A, sp_mat(diagmat(weights))) {}
+
+// The LU of A - sigma * M (or of M) is computed once per shift
+void Eigensolver::factorize(const sp_mat &K, Real sigma, bool shifted) {
+  if (lu.factorized() && lu_shifted == shifted && lu_sigma == sigma)
+    return;
+
+  try {
+    lu.factorize(K);
+  } catch (const std::runtime_error &) {
+    throw std::runtime_error("Eigensolver: singular shifted operator, "
+                             "choose a sigma that is not an eigenvalue");
+  }
+  lu_sigma = sigma;
+  lu_shifted = shifted;
+}
+
+Real Eigensolver::dot(const vec &u, const vec &v) const {
+  if (has_mass)
+    return arma::dot(u, vec(M * v));
+  return arma::dot(u, v);
+}
+
+bool Eigensolver::eigs(cx_vec &eigval, cx_mat &eigvec, u32 nev,
+                       const std::string &form) {
+  if (form == "sm")
+    return eigs(eigval, eigvec, nev, 0.0);
+
+  if (form != "lm")
+    throw std::invalid_argument("Unknown form, use \"sm\" or \"lm\"");
+
+  // Largest magnitude: no inversion of A, only of the mass matrix
+  bool ok;
+  if (has_mass) {
+    factorize(M, 0.0, false);
+    ok = arnoldi(eigval, eigvec, nev,
+                 [this](const vec &x) -> vec { return lu.solve(A * x); });
+  } else {
+    ok = arnoldi(eigval, eigvec, nev,
+                 [this](const vec &x) -> vec { return A * x; });
+  }
+  return ok;
+}
+
+bool Eigensolver::eigs(cx_vec &eigval, cx_mat &eigvec, u32 nev, Real sigma) {
+  sp_mat K = A;
+  if (sigma != 0.0)
+    K -= sigma * (has_mass ? M : sp_mat(speye(A.n_rows, A.n_cols)));
+  factorize(K, sigma, true);
+
+  bool ok;
+  if (has_mass)
+    ok = arnoldi(eigval, eigvec, nev,
+                 [this](const vec &x) -> vec { return lu.solve(M * x); });
+  else
+    ok = arnoldi(eigval, eigvec, nev,
+                 [this](const vec &x) -> vec { return lu.solve(x); });
+
+  // theta = 1 / (lambda - sigma), so the largest theta are nearest sigma
+  eigval = cx_double(sigma) + cx_double(1.0) / eigval;
+  return ok;
+}
+
+bool Eigensolver::arnoldi(cx_vec &theta, cx_mat &eigvec, u32 nev,
+                          const std::function<vec(const vec &)> &op) {
+  const u32 n = A.n_rows;
+  assert(nev > 0 && nev < n);
+
+  u32 m = ncv ? ncv : std::max(2 * nev + 1, 20u);
+  m = std::min(std::max(m, nev + 2), n);
+
+  mat V(n, m + 1, fill::zeros); // M-orthonormal Krylov basis
+  mat H(m + 1, m, fill::zeros); // Projection of op onto the basis
+
+  vec v = randu<vec>(n);
+  V.col(0) = v / std::sqrt(dot(v, v));
+
+  const Real eps = std::numeric_limits<Real>::epsilon();
+  u32 j0 = 0;
+  cx_vec ritz;
+  cx_mat Y;
+  uvec order;
+  bool converged = false;
+
+  for (u32 restart = 0; restart <= max_restarts; ++restart) {
+    // Extend the basis from j0 to m vectors
+    for (u32 j = j0; j < m; ++j) {
+      vec w = op(V.col(j));
+      const Real w_norm = std::sqrt(dot(w, w));
+
+      // Classical Gram-Schmidt, repeated once for numerical orthogonality
+      for (int pass = 0; pass < 2; ++pass) {
+        vec Mw = has_mass ? vec(M * w) : w;
+        vec h = V.cols(0, j).t() * Mw;
+        w -= V.cols(0, j) * h;
+        H(span(0, j), j) += h;
+      }
+
+      Real beta = std::sqrt(dot(w, w));
+      if (beta <= eps * w_norm) {
+        // Invariant subspace, continue with a fresh orthogonal direction
+        w = randu<vec>(n);
+        for (int pass = 0; pass < 2; ++pass) {
+          vec Mw = has_mass ? vec(M * w) : w;
+          w -= V.cols(0, j) * (V.cols(0, j).t() * Mw);
+        }
+        V.col(j + 1) = w / std::sqrt(dot(w, w));
+        H(j + 1, j) = 0.0;
+      } else {
+        V.col(j + 1) = w / beta;
+        H(j + 1, j) = beta;
+      }
+    }
+
+    // Ritz pairs of the projected problem, wanted ones first
+    const mat Hm = H.submat(0, 0, m - 1, m - 1);
+    eig_gen(ritz, Y, Hm);
+    order = sort_index(abs(ritz), "descend");
+
+    const Real beta_m = H(m, m - 1);
+    u32 n_conv = 0;
+    for (u32 i = 0; i < nev; ++i) {
+      const Real residual = std::abs(beta_m * Y(m - 1, order(i)));
+      if (residual <= tol * std::max(std::abs(ritz(order(i))), eps))
+        ++n_conv;
+    }
+    if (n_conv == nev) {
+      converged = true;
+      break;
+    }
+    if (restart == max_restarts)
+      break;
+
+    // Thick restart: keep the wanted Ritz vectors, conjugate pairs together
+    u32 p = std::min(nev + (m - nev) / 2, m - 1);
+    auto unpaired = [&](u32 count) {
+      int balance = 0;
+      for (u32 i = 0; i < count; ++i) {
+        const Real im = ritz(order(i)).imag();
+        balance += (im > 0) - (im < 0);
+      }
+      return balance != 0;
+    };
+    if (unpaired(p))
+      p = (p + 1 < m) ? p + 1 : p - 1;
+
+    mat Z(m, 2 * p);
+    u32 col = 0;
+    for (u32 i = 0; i < p; ++i) {
+      const cx_vec y = Y.col(order(i));
+      const Real im = ritz(order(i)).imag();
+      if (im == 0) {
+        Z.col(col++) = real(y);
+      } else if (im > 0) {
+        Z.col(col++) = real(y);
+        Z.col(col++) = imag(y);
+      }
+    }
+
+    p = std::min(col, m - 1);
+    mat Q, R;
+    qr_econ(Q, R, Z.cols(0, p - 1));
+
+    const mat T = Q.t() * Hm * Q;
+    const rowvec b = beta_m * Q.row(m - 1);
+    const mat Vp = V.cols(0, m - 1) * Q;
+    V.cols(0, p - 1) = Vp;
+    V.col(p) = V.col(m);
+
+    H.zeros();
+    H.submat(0, 0, p - 1, p - 1) = T;
+    H.submat(p, 0, p, p - 1) = b;
+    j0 = p;
+  }
+
+  // Ritz vectors, unit length in the 2-norm
+  theta.set_size(nev);
+  eigvec.set_size(n, nev);
+  const cx_mat Vm = cx_mat(V.cols(0, m - 1), mat(n, m, fill::zeros));
+  for (u32 i = 0; i < nev; ++i) {
+    theta(i) = ritz(order(i));
+    eigvec.col(i) = Vm * Y.col(order(i));
+    eigvec.col(i) /= norm(eigvec.col(i));
+  }
+
+  return converged;
+}
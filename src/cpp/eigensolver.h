@@ -0,0 +1,105 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
+*/
+
+/*
+ * @file eigensolver.h
+ *
+ * @brief Sparse shift-invert eigensolver for mimetic operators
+ *
+ * @date 2026/10/19
+ */
+
+#ifndef EIGENSOLVER_H
+#define EIGENSOLVER_H
+
+#include "factorization.h"
+#include <functional>
+#include <string>
+
+/**
+ * @brief A few eigenpairs of A x = lambda M x for large sparse operators
+ *
+ * Uses a restarted Arnoldi method (thick restart with the wanted Ritz
+ * vectors) on (A - sigma M)^-1 M for the eigenvalues nearest sigma or of
+ * smallest magnitude, and on M^-1 A for those of largest magnitude. The
+ * sparse LU factorization is computed once per shift and reused by every
+ * iteration and by later calls with the same shift. When a mass matrix is
+ * given (e.g. the diagonal of the P or Q weights), the Krylov basis is
+ * orthonormal in the M inner product, so for M-self-adjoint operators the
+ * method reduces to Lanczos.
+ */
+class Eigensolver {
+
+public:
+  /**
+   * @brief Standard eigenproblem A x = lambda x
+   *
+   * @param A a square sparse operator, e.g. a Laplacian + BC
+   */
+  Eigensolver(const sp_mat &A);
+
+  /**
+   * @brief Generalized eigenproblem A x = lambda M x
+   *
+   * @param A a square sparse operator
+   * @param M a symmetric positive definite mass matrix
+   */
+  Eigensolver(const sp_mat &A, const sp_mat &M);
+
+  /**
+   * @brief Generalized eigenproblem with a diagonal mass matrix
+   *
+   * @param A a square sparse operator
+   * @param weights the diagonal of the mass matrix (P or Q weights)
+   */
+  Eigensolver(const sp_mat &A, const vec &weights);
+
+  /**
+   * @brief Eigenpairs of smallest ("sm") or largest ("lm") magnitude
+   *
+   * @param eigval will hold the nev eigenvalues
+   * @param eigvec will hold the eigenvectors, one per column
+   * @param nev number of wanted eigenpairs
+   * @param form "sm" (default) or "lm"
+   *
+   * @returns true when all nev eigenpairs converged
+   */
+  bool eigs(cx_vec &eigval, cx_mat &eigvec, u32 nev,
+            const std::string &form = "sm");
+
+  /**
+   * @brief Eigenpairs nearest to the shift sigma
+   *
+   * @param eigval will hold the nev eigenvalues, nearest first
+   * @param eigvec will hold the eigenvectors, one per column
+   * @param nev number of wanted eigenpairs
+   * @param sigma the shift
+   *
+   * @returns true when all nev eigenpairs converged
+   */
+  bool eigs(cx_vec &eigval, cx_mat &eigvec, u32 nev, Real sigma);
+
+  Real tol = 1e-10;      ///< Relative residual tolerance of the Ritz pairs
+  u32 ncv = 0;           ///< Krylov subspace size, 0 picks max(2*nev+1, 20)
+  u32 max_restarts = 300; ///< Maximum number of restarts
+
+private:
+  sp_mat A;
+  sp_mat M;
+  bool has_mass;
+
+  Factorization lu;
+  Real lu_sigma;
+  bool lu_shifted;
+
+  void factorize(const sp_mat &K, Real sigma, bool shifted);
+  Real dot(const vec &u, const vec &v) const;
+
+  bool arnoldi(cx_vec &theta, cx_mat &eigvec, u32 nev,
+               const std::function<vec(const vec &)> &op);
+};
+
+#endif // EIGENSOLVER_H
@@ -0,0 +1,153 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
+*/
+
+/*
+ * @file expression.cpp
+ *
+ * @brief Unevaluated compositions of mimetic operators
+ *
+ * @date 2026/10/19
+ */
+
+#include "expression.h"
+#include <cassert>
+#include <utility>
+
+OperatorExpression::OperatorExpression(const sp_mat &A)
+    : n_rows(A.n_rows), n_cols(A.n_cols) {
+  // Non-owning, the operators outlive the expressions built from them
+  Factor f;
+  f.A = std::shared_ptr<const sp_mat>(&A, [](const sp_mat *) {});
+  terms.push_back({1.0, {f}});
+}
+
+OperatorExpression::OperatorExpression(sp_mat &&A)
+    : n_rows(A.n_rows), n_cols(A.n_cols) {
+  Factor f;
+  f.A = std::make_shared<const sp_mat>(std::move(A));
+  terms.push_back({1.0, {f}});
+}
+
+OperatorExpression::OperatorExpression(const vec &d)
+    : n_rows(d.n_elem), n_cols(d.n_elem) {
+  Factor f;
+  f.d = d;
+  terms.push_back({1.0, {f}});
+}
+
+void OperatorExpression::apply_factor(const Factor &f, vec &x) {
+  if (f.A) {
+    vec y = (*f.A) * x;
+    x = std::move(y);
+  } else
+    x %= f.d;
+}
+
+void OperatorExpression::apply_factor(const Factor &f, mat &X) {
+  if (f.A) {
+    mat Y = Utils::spmm(*f.A, X);
+    X = std::move(Y);
+  } else
+    X.each_col() %= f.d;
+}
+
+sp_mat OperatorExpression::to_sp_mat(const Factor &f) {
+  if (f.A)
+    return *f.A;
+
+  sp_mat D(f.d.n_elem, f.d.n_elem);
+  D.diag() = f.d;
+  return D;
+}
+
+vec OperatorExpression::apply(const vec &x) const {
+  assert(x.n_elem == n_cols);
+
+  vec y(n_rows, fill::zeros);
+  for (const Term &t : terms) {
+    vec z = x;
+    for (auto f = t.factors.rbegin(); f != t.factors.rend(); ++f)
+      apply_factor(*f, z);
+    y += t.scale * z;
+  }
+
+  return y;
+}
+
+mat OperatorExpression::apply(const mat &X) const {
+  assert(X.n_rows == n_cols);
+
+  mat Y(n_rows, X.n_cols, fill::zeros);
+  for (const Term &t : terms) {
+    mat Z = X;
+    for (auto f = t.factors.rbegin(); f != t.factors.rend(); ++f)
+      apply_factor(*f, Z);
+    Y += t.scale * Z;
+  }
+
+  return Y;
+}
+
+sp_mat OperatorExpression::eval() const {
+  sp_mat result(n_rows, n_cols);
+  for (const Term &t : terms) {
+    sp_mat product = to_sp_mat(t.factors.front());
+    for (size_t i = 1; i < t.factors.size(); ++i) {
+      const Factor &f = t.factors[i];
+      if (f.A)
+        product = product * (*f.A);
+      else
+        product = product * to_sp_mat(f);
+    }
+    result += t.scale * product;
+  }
+
+  return result;
+}
+
+OperatorExpression
+OperatorExpression::operator+(const OperatorExpression &other) const {
+  assert(n_rows == other.n_rows && n_cols == other.n_cols);
+
+  OperatorExpression result = *this;
+  result.terms.insert(result.terms.end(), other.terms.begin(),
+                      other.terms.end());
+  return result;
+}
+
+OperatorExpression
+OperatorExpression::operator-(const OperatorExpression &other) const {
+  return *this + (-other);
+}
+
+OperatorExpression
+OperatorExpression::operator*(const OperatorExpression &other) const {
+  assert(n_cols == other.n_rows);
+
+  // Distribute: (a + b) * (c + d) = a*c + a*d + b*c + b*d
+  OperatorExpression result = *this;
+  result.terms.clear();
+  result.n_cols = other.n_cols;
+  for (const Term &left : terms)
+    for (const Term &right : other.terms) {
+      Term t{left.scale * right.scale, left.factors};
+      t.factors.insert(t.factors.end(), right.factors.begin(),
+                       right.factors.end());
+      result.terms.push_back(t);
+    }
+  return result;
+}
+
+OperatorExpression OperatorExpression::operator*(Real scale) const {
+  OperatorExpression result = *this;
+  for (Term &t : result.terms)
+    t.scale *= scale;
+  return result;
+}
+
+OperatorExpression OperatorExpression::operator-() const {
+  return *this * -1.0;
+}
@@ -0,0 +1,143 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
+*/
+
+/*
+ * @file expression.h
+ *
+ * @brief Unevaluated compositions of mimetic operators
+ *
+ * @date 2026/10/19
+ */
+
+#ifndef EXPRESSION_H
+#define EXPRESSION_H
+
+#include "utils.h"
+#include <memory>
+#include <vector>
+
+/**
+ * @brief Lazy sum of scaled products of mimetic operators
+ *
+ * An expression such as div * grad, lap + bc or
+ * dt * (D * K * G) + I is kept as a list of terms, each one a scalar times
+ * a chain of factors. A factor is either a sparse matrix or a diagonal
+ * given by a vector of coefficients. Applying the expression to a vector
+ * applies the factors one after the other, e.g. D * (K % (G * u)), so the
+ * explicit product, which has more nonzeros per row than its factors, is
+ * never formed. eval() (or the conversion to sp_mat) assembles the matrix,
+ * which is only needed by direct solvers.
+ *
+ * The operators themselves compose into assembled sp_mat, so an
+ * expression is started explicitly, e.g. OperatorExpression(D) * G or
+ * OperatorExpression(L) + BC. Sparse matrices combined with it are then
+ * kept as factors too.
+ *
+ * @note The expression refers to the named operators it is built from
+ * instead of copying them, so they must outlive it. Temporaries, e.g.
+ * OperatorExpression(D * G) or E + (sp_mat)L, are moved into the
+ * expression and owned by it.
+ */
+class OperatorExpression {
+
+public:
+  /**
+   * @brief Expression referring to a single sparse operator, not a copy
+   *
+   * @param A any sparse operator (Gradient, Divergence, Laplacian, ...),
+   * which must outlive the expression
+   */
+  explicit OperatorExpression(const sp_mat &A);
+
+  /**
+   * @brief Expression owning a single sparse operator, moved in
+   *
+   * @param A a temporary sparse operator
+   */
+  explicit OperatorExpression(sp_mat &&A);
+
+  /**
+   * @brief Expression holding a diagonal operator
+   *
+   * @param d the diagonal, e.g. face coefficients K for D * K * G
+   */
+  explicit OperatorExpression(const vec &d);
+
+  /**
+   * @brief Applies the expression to a vector without assembling it
+   *
+   * @param x a vector with n_cols entries
+   */
+  vec apply(const vec &x) const;
+
+  /**
+   * @brief Applies the expression to many fields at once
+   *
+   * @param X a matrix with n_cols rows, one column per field
+   *
+   * @note Sparse factors are applied with Utils::spmm, in parallel over
+   * blocks of columns.
+   */
+  mat apply(const mat &X) const;
+
+  /**
+   * @brief Assembles the expression into a sparse matrix
+   */
+  sp_mat eval() const;
+
+  /**
+   * @brief Implicit assembly, e.g. for passing an expression to spsolve
+   */
+  operator sp_mat() const { return eval(); }
+
+  /**
+   * @brief Sum of two expressions
+   */
+  OperatorExpression operator+(const OperatorExpression &other) const;
+
+  /**
+   * @brief Difference of two expressions
+   */
+  OperatorExpression operator-(const OperatorExpression &other) const;
+
+  /**
+   * @brief Composition of two expressions, this applied after other
+   */
+  OperatorExpression operator*(const OperatorExpression &other) const;
+
+  /**
+   * @brief Expression scaled by a constant
+   */
+  OperatorExpression operator*(Real scale) const;
+
+  /**
+   * @brief Negated expression
+   */
+  OperatorExpression operator-() const;
+
+  u32 n_rows; ///< Number of rows of the represented operator
+  u32 n_cols; ///< Number of columns of the represented operator
+
+private:
+  struct Factor {
+    std::shared_ptr<const sp_mat> A; ///< Sparse factor, or null for a diagonal,
+                                     ///< owned only if it was moved in
+    vec d;                           ///< Diagonal factor when A is null
+  };
+
+  struct Term {
+    Real scale;
+    std::vector<Factor> factors; ///< Applied right to left
+  };
+
+  std::vector<Term> terms;
+
+  static void apply_factor(const Factor &f, vec &x);
+  static void apply_factor(const Factor &f, mat &X);
+  static sp_mat to_sp_mat(const Factor &f);
+};
+
+#endif // EXPRESSION_H
@@ -0,0 +1,133 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
+*/
+
+/*
+ * @file factorization.cpp
+ *
+ * @brief Reusable sparse LU factorization
+ *
+ * @date 2026/10/19
+ */
+
+#include "factorization.h"
+#include <algorithm>
+#include <cassert>
+#include <stdexcept>
+
+struct Factorization::Impl {
+  bool keep_ordering = false;
+#ifdef EIGEN
+  Utils::EigenLU solver;
+  Eigen::SparseLU<Eigen::SparseMatrix<Real>, Eigen::NaturalOrdering<int>>
+      natural; ///< Used instead of solver when keep_ordering is set
+  std::vector<int> col_ptrs;    ///< Pattern of the analyzed matrix
+  std::vector<int> row_indices; ///< in Eigen's index type
+
+  // Wraps the CSC arrays of A, which must have the analyzed pattern
+  Eigen::SparseMatrix<Real> wrap(const sp_mat &A) const {
+    return Eigen::Map<const Eigen::SparseMatrix<Real>>(
+        A.n_rows, A.n_cols, A.n_nonzero, col_ptrs.data(), row_indices.data(),
+        A.values);
+  }
+
+  // Numeric factorization with whichever solver is in use
+  bool numeric(const Eigen::SparseMatrix<Real> &A) {
+    if (keep_ordering) {
+      natural.factorize(A);
+      return natural.info() == Eigen::Success;
+    }
+    solver.factorize(A);
+    return solver.info() == Eigen::Success;
+  }
+#else
+  spsolve_factoriser solver;
+#endif
+};
+
+Factorization::Factorization() = default;
+
+Factorization::Factorization(const sp_mat &A, bool keep_ordering) {
+  factorize(A, keep_ordering);
+}
+
+Factorization::~Factorization() = default;
+
+Factorization::Factorization(Factorization &&other) noexcept = default;
+
+Factorization &
+Factorization::operator=(Factorization &&other) noexcept = default;
+
+void Factorization::factorize(const sp_mat &A, bool keep_ordering) {
+  assert(A.n_rows == A.n_cols);
+
+  impl = std::make_unique<Impl>();
+  impl->keep_ordering = keep_ordering;
+#ifdef EIGEN
+  A.sync();
+  impl->col_ptrs.assign(A.col_ptrs, A.col_ptrs + A.n_cols + 1);
+  impl->row_indices.assign(A.row_indices, A.row_indices + A.n_nonzero);
+
+  Eigen::SparseMatrix<Real> eigen_A = impl->wrap(A);
+  if (keep_ordering)
+    impl->natural.analyzePattern(eigen_A);
+  else
+    impl->solver.analyzePattern(eigen_A);
+  bool ok = impl->numeric(eigen_A);
+#else
+  superlu_opts opts;
+  if (keep_ordering)
+    opts.permutation = superlu_opts::NATURAL;
+  bool ok = impl->solver.factorise(A, opts);
+#endif
+  if (!ok) {
+    impl.reset();
+    throw std::runtime_error("Factorization: the matrix is singular");
+  }
+}
+
+void Factorization::refactorize(const sp_mat &A) {
+  if (!impl) {
+    factorize(A);
+    return;
+  }
+#ifdef EIGEN
+  A.sync();
+  assert(A.n_nonzero == impl->row_indices.size());
+  assert(std::equal(impl->row_indices.begin(), impl->row_indices.end(),
+                    A.row_indices));
+
+  if (!impl->numeric(impl->wrap(A))) {
+    impl.reset();
+    throw std::runtime_error("Factorization: the matrix is singular");
+  }
+#else
+  factorize(A, impl->keep_ordering);
+#endif
+}
+
+#ifdef EIGEN
+uword Factorization::factor_nnz() const {
+  assert(impl);
+  return impl->keep_ordering
+             ? impl->natural.nnzL() + impl->natural.nnzU()
+             : impl->solver.nnzL() + impl->solver.nnzU();
+}
+#endif
+
+vec Factorization::solve(const vec &b) const {
+  assert(impl);
+#ifdef EIGEN
+  Eigen::Map<const Eigen::VectorXd> eigen_b(b.memptr(), b.n_elem);
+  Eigen::VectorXd eigen_x = impl->keep_ordering
+                                ? Eigen::VectorXd(impl->natural.solve(eigen_b))
+                                : Eigen::VectorXd(impl->solver.solve(eigen_b));
+  return vec(eigen_x.data(), eigen_x.size());
+#else
+  vec x;
+  impl->solver.solve(x, b);
+  return x;
+#endif
+}
@@ -0,0 +1,103 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
+*/
+
+/*
+ * @file factorization.h
+ *
+ * @brief Reusable sparse LU factorization
+ *
+ * @date 2026/10/19
+ */
+
+#ifndef FACTORIZATION_H
+#define FACTORIZATION_H
+
+#include "utils.h"
+#include <memory>
+
+/**
+ * @brief Sparse LU factorization that is computed once and solved many times
+ *
+ * Uses Eigen's SparseLU when EIGEN is defined and Armadillo's
+ * spsolve_factoriser (SuperLU) otherwise. When only the values of the
+ * matrix change, e.g. a VariableLaplacian after refresh(), refactorize()
+ * reuses the fill-reducing ordering and symbolic analysis of the pattern.
+ * This numeric-only refactorization is implemented for EIGEN only, the
+ * SuperLU path factorizes from scratch (see refactorize()).
+ * A matrix already reordered with an Ordering can keep its ordering, which
+ * skips the default COLAMD column permutation.
+ */
+class Factorization {
+
+public:
+  /**
+   * @brief Empty factorization, call factorize() before solve()
+   */
+  Factorization();
+
+  /**
+   * @brief Factorizes A
+   *
+   * @param A a square sparse matrix, e.g. Laplacian + BC
+   * @param keep_ordering factorize A in its own ordering, without COLAMD
+   */
+  explicit Factorization(const sp_mat &A, bool keep_ordering = false);
+
+  ~Factorization();
+  Factorization(Factorization &&other) noexcept;
+  Factorization &operator=(Factorization &&other) noexcept;
+
+  /**
+   * @brief Computes the LU factors of A, replacing any previous ones
+   *
+   * @param A a square sparse matrix
+   * @param keep_ordering factorize A in its own ordering, without COLAMD
+   *
+   * @note Throws std::runtime_error when A is singular
+   */
+  void factorize(const sp_mat &A, bool keep_ordering = false);
+
+  /**
+   * @brief Numeric refactorization of a matrix with the same pattern
+   *
+   * @param A a sparse matrix with the nonzero pattern of the one given to
+   * factorize(), including any explicitly stored zeros
+   *
+   * @warning Pattern reuse is implemented for EIGEN only. Armadillo's
+   * spsolve_factoriser exposes no separate numeric phase, so without EIGEN
+   * this calls factorize() and redoes the ordering and symbolic analysis:
+   * the result is correct but refactorize() is no faster than factorize().
+   */
+  void refactorize(const sp_mat &A);
+
+  /**
+   * @brief Solves A x = b with the stored factors
+   *
+   * @param b the RHS
+   */
+  vec solve(const vec &b) const;
+
+#ifdef EIGEN
+  /**
+   * @brief Number of nonzeros of the L and U factors
+   *
+   * Measures the fill-in of the ordering in use, and with it the memory
+   * of the factors.
+   */
+  uword factor_nnz() const;
+#endif
+
+  /**
+   * @brief Whether the factors of a matrix are available
+   */
+  bool factorized() const { return impl != nullptr; }
+
+private:
+  struct Impl;
+  std::unique_ptr<Impl> impl;
+};
+
+#endif // FACTORIZATION_H
@@ -0,0 +1,290 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
+*/
+
+/*
+ * @file fftsolver.cpp
+ *
+ * @brief Fast Poisson solver for periodic and mixed periodic domains
+ *
+ * @date 2026/10/19
+ */
+
+#include "fftsolver.h"
+#include "laplacian.h"
+#include "robinbc.h"
+#include <algorithm>
+#include <cassert>
+#include <stdexcept>
+
+// FFT, or inverse FFT, of X along direction d
+static void fft_along(cx_cube &X, int d, bool inverse) {
+  if (d == 0) {
+    for (uword s = 0; s < X.n_slices; ++s) {
+      cx_mat F = inverse ? cx_mat(ifft(X.slice(s))) : cx_mat(fft(X.slice(s)));
+      X.slice(s) = F;
+    }
+  } else if (d == 1) {
+    for (uword s = 0; s < X.n_slices; ++s) {
+      cx_mat T = X.slice(s).st();
+      cx_mat F = inverse ? cx_mat(ifft(T)) : cx_mat(fft(T));
+      X.slice(s) = F.st();
+    }
+  } else {
+    // The slices are contiguous, so z is along the rows of this view
+    cx_mat M(X.memptr(), X.n_rows * X.n_cols, X.n_slices, false, true);
+    cx_mat T = M.st();
+    cx_mat F = inverse ? cx_mat(ifft(T)) : cx_mat(fft(T));
+    M = F.st();
+  }
+}
+
+FFTSolver::FFTSolver(u16 k, u32 m, Real dx)
+    : k(k), dim(1), cells{m, 1, 1}, spacing{dx, 1, 1},
+      periodic{true, true, true}, a(1), b(0) {
+  setup();
+}
+
+FFTSolver::FFTSolver(u16 k, u32 m, u32 n, Real dx, Real dy, Periodic periodic,
+                     Real a, Real b)
+    : k(k), dim(2), cells{m, n, 1}, spacing{dx, dy, 1},
+      periodic{periodic.x, periodic.y, true}, a(a), b(b) {
+  setup();
+}
+
+FFTSolver::FFTSolver(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz,
+                     Periodic periodic, Real a, Real b)
+    : k(k), dim(3), cells{m, n, o}, spacing{dx, dy, dz},
+      periodic{periodic.x, periodic.y, periodic.z}, a(a), b(b) {
+  setup();
+}
+
+void FFTSolver::setup() {
+  for (int d = 0; d < 3; ++d) {
+    if (d < dim) {
+      (periodic[d] ? pdims : qdims).push_back(d);
+      points[d] = periodic[d] ? cells[d] : cells[d] + 2;
+    } else
+      points[d] = 1;
+  }
+  strides[0] = 1;
+  strides[1] = points[0];
+  strides[2] = points[0] * points[1];
+
+  // Eigenvalues of the circulant 1-D Laplacians, the FFT of a column
+  std::fill(modes, modes + 3, 1);
+  std::fill(mode_strides, mode_strides + 3, 0);
+  std::fill(folded, folded + 3, 1);
+  for (std::size_t i = 0; i < pdims.size(); ++i) {
+    const int d = pdims[i];
+    Laplacian C(k, cells[d], spacing[d], Periodic{true});
+    vec c(cells[d], fill::zeros);
+    for (auto it = C.begin_col(0); it != C.end_col(0); ++it)
+      c(it.row()) = *it;
+    eigvals.push_back(real(fft(c)));
+
+    modes[i] = points[d];
+    mode_strides[i] = strides[d];
+    folded[i] = points[d] / 2 + 1;
+  }
+
+  // Unknowns of one mode along the non-periodic directions
+  uword qn[3] = {1, 1, 1}, qs[3] = {0, 0, 0};
+  for (std::size_t i = 0; i < qdims.size(); ++i) {
+    qn[i] = points[qdims[i]];
+    qs[i] = strides[qdims[i]];
+  }
+  offsets.set_size(qn[0] * qn[1] * qn[2]);
+  vec interior(offsets.n_elem);
+  uword p = 0;
+  for (uword i2 = 0; i2 < qn[2]; ++i2)
+    for (uword i1 = 0; i1 < qn[1]; ++i1)
+      for (uword i0 = 0; i0 < qn[0]; ++i0, ++p) {
+        offsets(p) = i0 * qs[0] + i1 * qs[1] + i2 * qs[2];
+        const uword idx[3] = {i0, i1, i2};
+        interior(p) = 1;
+        for (std::size_t i = 0; i < qdims.size(); ++i)
+          if (idx[i] == 0 || idx[i] == qn[i] - 1)
+            interior(p) = 0;
+      }
+
+  pinned = false;
+  if (qdims.empty())
+    return;
+
+  // L and the BC along the non-periodic directions
+  const int q0 = qdims[0];
+  sp_mat lap;
+  if (qdims.size() == 1) {
+    lap = Laplacian(k, cells[q0], spacing[q0]);
+    bc = RobinBC(k, cells[q0], spacing[q0], a, b);
+  } else if (qdims.size() == 2) {
+    const int q1 = qdims[1];
+    lap = Laplacian(k, cells[q0], cells[q1], spacing[q0], spacing[q1]);
+    bc = RobinBC(k, cells[q0], spacing[q0], cells[q1], spacing[q1], a, b);
+  } else {
+    lap = Laplacian(k, cells[0], cells[1], cells[2], spacing[0], spacing[1],
+                    spacing[2]);
+    bc = RobinBC(k, cells[0], spacing[0], cells[1], spacing[1], cells[2],
+                 spacing[2], a, b);
+  }
+
+  // lap + bc in LAPACK band storage, A(i, j) is at (kl + ku + i - j, j)
+  // and the first kl rows are left for the fill of the row interchanges
+  const sp_mat A = lap + bc;
+  kl = ku = 0;
+  for (auto it = A.begin(); it != A.end(); ++it) {
+    const blas_int offset = blas_int(it.row()) - blas_int(it.col());
+    kl = std::max(kl, offset);
+    ku = std::max(ku, -offset);
+  }
+  const uword n = A.n_rows;
+  mat band(2 * kl + ku + 1, n, fill::zeros);
+  for (auto it = A.begin(); it != A.end(); ++it)
+    band(kl + ku + it.row() - it.col(), it.col()) = *it;
+  pinned = a == 0;
+
+  const sword n_keys = folded[0] * folded[1] * folded[2];
+  factors.set_size(band.n_rows, n, n_keys);
+  pivots.set_size(n, n_keys);
+  bool singular = false;
+
+#pragma omp parallel for schedule(dynamic) reduction(|| : singular)
+  for (sword key = 0; key < n_keys; ++key) {
+    const uword h[3] = {key % folded[0], (key / folded[0]) % folded[1],
+                        key / (folded[0] * folded[1])};
+    Real lambda = 0;
+    for (std::size_t i = 0; i < pdims.size(); ++i)
+      lambda += eigvals[i](h[i]);
+
+    // The periodic directions add eigval * u at the interior points
+    mat K(factors.slice_memptr(key), band.n_rows, n, false, true);
+    K = band;
+    K.row(kl + ku) += lambda * interior.t();
+    if (pinned && key == 0) {
+      for (blas_int j = 0; j <= ku; ++j)
+        K(kl + ku - j, j) = 0;
+      K(kl + ku, 0) = 1;
+    }
+
+    blas_int rows = n, cols = n, lower = kl, upper = ku, ld = K.n_rows;
+    blas_int info = 0;
+    lapack::gbtrf(&rows, &cols, &lower, &upper, K.memptr(), &ld,
+                  pivots.colptr(key), &info);
+    singular = singular || info != 0;
+  }
+
+  if (singular)
+    throw std::runtime_error("FFTSolver: the matrix is singular");
+}
+
+vec FFTSolver::solve(const vec &f) const {
+  assert(f.n_elem == points[0] * points[1] * points[2]);
+
+  cx_cube X(cube(f.memptr(), points[0], points[1], points[2]),
+            cube(points[0], points[1], points[2], fill::zeros));
+  for (int d : pdims)
+    fft_along(X, d, false);
+
+  if (qdims.empty()) {
+    const sword n_modes = modes[0] * modes[1] * modes[2];
+
+#pragma omp parallel for
+    for (sword t = 0; t < n_modes; ++t) {
+      const uword j[3] = {t % modes[0], (t / modes[0]) % modes[1],
+                          t / (modes[0] * modes[1])};
+      Real lambda = 0;
+      for (std::size_t i = 0; i < pdims.size(); ++i)
+        lambda += eigvals[i](j[i]);
+      // The zero mode is the mean of u
+      const uword base = j[0] * mode_strides[0] + j[1] * mode_strides[1] +
+                         j[2] * mode_strides[2];
+      X(base) = t == 0 ? cx_double(0) : X(base) / lambda;
+    }
+  } else {
+    const sword n_keys = factors.n_slices;
+
+    // The modes that share a factorization are solved together, the real
+    // and imaginary parts of each one as two right-hand sides
+#pragma omp parallel for schedule(dynamic)
+    for (sword key = 0; key < n_keys; ++key) {
+      const uword h[3] = {key % folded[0], (key / folded[0]) % folded[1],
+                          key / (folded[0] * folded[1])};
+
+      // Modes h or m - h along each periodic direction
+      std::vector<uword> bases;
+      for (int c = 0; c < 8; ++c) {
+        uword base = 0;
+        bool distinct = true;
+        for (int i = 0; i < 3; ++i) {
+          const bool mirror = c & (1 << i);
+          if (mirror && (h[i] == 0 || 2 * h[i] == modes[i]))
+            distinct = false;
+          base += (mirror ? modes[i] - h[i] : h[i]) * mode_strides[i];
+        }
+        if (distinct)
+          bases.push_back(base);
+      }
+
+      mat B(offsets.n_elem, 2 * bases.size());
+      for (std::size_t s = 0; s < bases.size(); ++s) {
+        const cx_vec r = X.elem(bases[s] + offsets);
+        B.col(2 * s) = real(r);
+        B.col(2 * s + 1) = imag(r);
+      }
+      if (pinned && key == 0)
+        B.row(0).zeros();
+
+      char trans = 'N';
+      blas_int n = B.n_rows, lower = kl, upper = ku, nrhs = B.n_cols;
+      blas_int ld = factors.n_rows, info = 0;
+      lapack::gbtrs(&trans, &n, &lower, &upper, &nrhs,
+                    const_cast<Real *>(factors.slice_memptr(key)), &ld,
+                    const_cast<blas_int *>(pivots.colptr(key)), B.memptr(), &n,
+                    &info);
+
+      for (std::size_t s = 0; s < bases.size(); ++s)
+        X.elem(bases[s] + offsets) = cx_vec(B.col(2 * s), B.col(2 * s + 1));
+    }
+  }
+
+  for (int d : pdims)
+    fft_along(X, d, true);
+
+  return vectorise(real(X));
+}
+
+sp_mat FFTSolver::matrix() const {
+  sp_mat L;
+  if (dim == 1)
+    L = Laplacian(k, cells[0], spacing[0], Periodic{true});
+  else if (dim == 2)
+    L = Laplacian(k, cells[0], cells[1], spacing[0], spacing[1],
+                  Periodic{periodic[0], periodic[1]});
+  else
+    L = Laplacian(k, cells[0], cells[1], cells[2], spacing[0], spacing[1],
+                  spacing[2], Periodic{periodic[0], periodic[1], periodic[2]});
+
+  if (qdims.empty())
+    return L;
+
+  // The BC of a mode, at every point along the periodic directions
+  const uword n_modes = modes[0] * modes[1] * modes[2];
+  umat locations(2, n_modes * bc.n_nonzero);
+  vec values(n_modes * bc.n_nonzero);
+  uword p = 0;
+  for (uword t = 0; t < n_modes; ++t) {
+    const uword base = (t % modes[0]) * mode_strides[0] +
+                       ((t / modes[0]) % modes[1]) * mode_strides[1] +
+                       (t / (modes[0] * modes[1])) * mode_strides[2];
+    for (auto it = bc.begin(); it != bc.end(); ++it, ++p) {
+      locations(0, p) = base + offsets(it.row());
+      locations(1, p) = base + offsets(it.col());
+      values(p) = *it;
+    }
+  }
+
+  return L + sp_mat(locations, values, L.n_rows, L.n_cols);
+}
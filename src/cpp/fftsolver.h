@@ -0,0 +1,129 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
+*/
+
+/*
+ * @file fftsolver.h
+ *
+ * @brief Fast Poisson solver for periodic and mixed periodic domains
+ *
+ * @date 2026/10/19
+ */
+
+#ifndef FFTSOLVER_H
+#define FFTSOLVER_H
+
+#include "utils.h"
+#include <vector>
+
+/**
+ * @brief Solves L u = f with FFTs along the periodic directions
+ *
+ * L is the periodic Laplacian of the mixed constructors plus a Robin BC
+ * (a*u + b*du/dn) on the boundaries of the non-periodic directions,
+ * which is what matrix() returns. Along a periodic direction L is
+ * circulant, so the FFT decouples the Fourier modes. Each mode leaves a
+ * 1-D or 2-D problem along the non-periodic directions, which is banded
+ * and factorized once with LAPACK's banded LU (gbtrf). A solve costs
+ * O(N log N) plus the banded back substitutions.
+ *
+ * Modes j and m - j have the same eigenvalue and share their factors,
+ * which are solved for all of them at once. The factors take
+ * (2 kl + ku + 1) values per unknown of a mode, where kl = ku is the
+ * bandwidth of its system: 3k / 2 - 1 with one non-periodic direction,
+ * and that times the points along the first one with two.
+ *
+ * @note When every direction is periodic the solution with zero mean is
+ * returned. When the non-periodic directions have pure Neumann BC
+ * (a = 0), u is set to zero at the first point. In both cases f must
+ * satisfy the compatibility condition.
+ *
+ * @note The modes are factorized and solved in parallel with OpenMP.
+ */
+class FFTSolver {
+
+public:
+  /**
+   * @brief 1-D periodic solver
+   *
+   * @param k Order of accuracy
+   * @param m Number of cells
+   * @param dx Spacing between cells
+   */
+  FFTSolver(u16 k, u32 m, Real dx);
+
+  /**
+   * @brief 2-D solver, periodic along x, y or both
+   *
+   * @param k Order of accuracy
+   * @param m Number of cells in x-direction
+   * @param n Number of cells in y-direction
+   * @param dx Spacing between cells in x-direction
+   * @param dy Spacing between cells in y-direction
+   * @param periodic Periodicity in x and y, e.g. Periodic{true, false}
+   * @param a Coefficient of the Dirichlet function on non-periodic
+   * boundaries
+   * @param b Coefficient of the Neumann function on non-periodic boundaries
+   */
+  FFTSolver(u16 k, u32 m, u32 n, Real dx, Real dy, Periodic periodic,
+            Real a = 1.0, Real b = 0.0);
+
+  /**
+   * @brief 3-D solver, periodic along any of x, y and z
+   *
+   * @param k Order of accuracy
+   * @param m Number of cells in x-direction
+   * @param n Number of cells in y-direction
+   * @param o Number of cells in z-direction
+   * @param dx Spacing between cells in x-direction
+   * @param dy Spacing between cells in y-direction
+   * @param dz Spacing between cells in z-direction
+   * @param periodic Periodicity in x, y and z
+   * @param a Coefficient of the Dirichlet function on non-periodic
+   * boundaries
+   * @param b Coefficient of the Neumann function on non-periodic boundaries
+   */
+  FFTSolver(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz,
+            Periodic periodic, Real a = 1.0, Real b = 0.0);
+
+  /**
+   * @brief Solves L u = f
+   *
+   * @param f the RHS, with the BC data at the non-periodic boundary points
+   */
+  vec solve(const vec &f) const;
+
+  /**
+   * @brief The operator L that solve() inverts, assembled as a sparse matrix
+   */
+  sp_mat matrix() const;
+
+private:
+  void setup();
+
+  u16 k;
+  int dim;
+  u32 cells[3];      ///< Number of cells per direction, 1 if unused
+  Real spacing[3];   ///< Spacing per direction
+  bool periodic[3];  ///< Periodicity per direction
+  uword points[3];   ///< Number of unknowns per direction
+  uword strides[3];  ///< Distance between neighbors per direction
+  Real a, b;
+
+  std::vector<int> pdims;     ///< Periodic directions
+  std::vector<int> qdims;     ///< Non-periodic directions
+  std::vector<vec> eigvals;   ///< Eigenvalues of L along each periodic one
+  uword modes[3];             ///< Number of modes per periodic one, padded
+  uword mode_strides[3];      ///< Their strides in the unknowns
+  uword folded[3];            ///< Number of modes per periodic one up to m-j
+  uvec offsets;               ///< Unknowns of one mode, relative to its base
+  sp_mat bc;                  ///< Robin BC of one mode
+  blas_int kl, ku;            ///< Lower and upper bandwidths of a mode
+  cube factors;               ///< Banded LU per mode up to symmetry, one per slice
+  Mat<blas_int> pivots;       ///< Row interchanges of each factorization
+  bool pinned;                ///< The zero mode fixes u at its first point
+};
+
+#endif // FFTSOLVER_H
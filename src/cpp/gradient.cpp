@@ -238,9 +238,6 @@ Gradient::Gradient(u16 k, u32 m, Real dx) : sp_mat(m + 1, m + 2) {
 
 // 2-D Constructor
 Gradient::Gradient(u16 k, u32 m, u32 n, Real dx, Real dy) {
-  Gradient Gx(k, m, dx);
-  Gradient Gy(k, n, dy);
-
   sp_mat Im = speye(m + 2, m + 2);
   sp_mat In = speye(n + 2, n + 2);
 
@@ -249,8 +246,12 @@ Gradient::Gradient(u16 k, u32 m, u32 n, Real dx, Real dy) {
   In.shed_row(0);
   In.shed_row(n);
 
-  sp_mat G1 = Utils::spkron(In, Gx);
-  sp_mat G2 = Utils::spkron(Gy, Im);
+  // The blocks are independent, each task builds its own 1-D operator
+  sp_mat G1, G2;
+  Utils::run_tasks({
+      [&] { G1 = Utils::spkron(In, Gradient(k, m, dx)); },
+      [&] { G2 = Utils::spkron(Gradient(k, n, dy), Im); },
+  });
 
   // Dimensions = 2*m*n+m+n, (m+2)*(n+2)
   if (m != n)
@@ -265,10 +266,6 @@ Gradient::Gradient(u16 k, u32 m, u32 n, Real dx, Real dy) {
 
 // 3-D Constructor
 Gradient::Gradient(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz) {
-  Gradient Gx(k, m, dx);
-  Gradient Gy(k, n, dy);
-  Gradient Gz(k, o, dz);
-
   sp_mat Im = speye(m + 2, m + 2);
   sp_mat In = speye(n + 2, n + 2);
   sp_mat Io = speye(o + 2, o + 2);
@@ -280,9 +277,13 @@ Gradient::Gradient(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz) {
   Io.shed_row(0);
   Io.shed_row(o);
 
-  sp_mat G1 = Utils::spkron(Utils::spkron(Io, In), Gx);
-  sp_mat G2 = Utils::spkron(Utils::spkron(Io, Gy), Im);
-  sp_mat G3 = Utils::spkron(Utils::spkron(Gz, In), Im);
+  // The blocks are independent, each task builds its own 1-D operator
+  sp_mat G1, G2, G3;
+  Utils::run_tasks({
+      [&] { G1 = Utils::spkron(Utils::spkron(Io, In), Gradient(k, m, dx)); },
+      [&] { G2 = Utils::spkron(Utils::spkron(Io, Gradient(k, n, dy)), Im); },
+      [&] { G3 = Utils::spkron(Utils::spkron(Gradient(k, o, dz), In), Im); },
+  });
 
   // Dimensions = 3*m*n*o+m*n+m*o+n*o, (m+2)*(n+2)*(o+2)
   if ((m != n) || (n != o))
@@ -297,5 +298,93 @@ Gradient::Gradient(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz) {
   }
 }
 
+// 1-D Periodic Constructor
+Gradient::Gradient(u16 k, u32 m, Real dx, Periodic periodic) {
+  if (!periodic.x) {
+    *this = Gradient(k, m, dx);
+    return;
+  }
+
+  assert(!(k % 2));
+  assert(k > 1 && k < 9);
+  assert(m >= k);
+
+  // Interior stencils, from cells i-k/2, ..., i+k/2-1 to face i
+  vec c;
+  switch (k) {
+  case 2:
+    c = {-1.0, 1.0};
+    break;
+  case 4:
+    c = {1.0 / 24.0, -9.0 / 8.0, 9.0 / 8.0, -1.0 / 24.0};
+    break;
+  case 6:
+    c = {-3.0 / 640.0, 25.0 / 384.0,  -75.0 / 64.0,
+         75.0 / 64.0,  -25.0 / 384.0, 3.0 / 640.0};
+    break;
+  case 8:
+    c = {5.0 / 7168.0,    -49.0 / 5120.0,  245.0 / 3072.0, -1225.0 / 1024.0,
+         1225.0 / 1024.0, -245.0 / 3072.0, 49.0 / 5120.0,  -5.0 / 7168.0};
+    break;
+  }
+
+  // Dimensions = m, m
+  set_size(m, m);
+  for (u32 i = 0; i < m; i++)
+    for (u16 r = 0; r < k; r++)
+      at(i, (i + m - k / 2 + r) % m) = c(r);
+
+  // Uniform weights, there is no boundary
+  P = ones<vec>(m);
+
+  // Scaling
+  *this /= dx;
+}
+
+// 2-D Constructor, periodic along some directions
+Gradient::Gradient(u16 k, u32 m, u32 n, Real dx, Real dy,
+                   Periodic periodic) {
+  const sp_mat Im = Utils::face_cells(m, periodic.x);
+  const sp_mat In = Utils::face_cells(n, periodic.y);
+
+  sp_mat G1, G2;
+  Utils::run_tasks({
+      [&] {
+        G1 = Utils::spkron(In, Gradient(k, m, dx, Periodic{periodic.x}));
+      },
+      [&] {
+        G2 = Utils::spkron(Gradient(k, n, dy, Periodic{periodic.y}), Im);
+      },
+  });
+
+  *this = Utils::spjoin_cols(G1, G2);
+}
+
+// 3-D Constructor, periodic along some directions
+Gradient::Gradient(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz,
+                   Periodic periodic) {
+  const sp_mat Im = Utils::face_cells(m, periodic.x);
+  const sp_mat In = Utils::face_cells(n, periodic.y);
+  const sp_mat Io = Utils::face_cells(o, periodic.z);
+
+  sp_mat G1, G2, G3;
+  Utils::run_tasks({
+      [&] {
+        G1 = Utils::spkron(Utils::spkron(Io, In),
+                           Gradient(k, m, dx, Periodic{periodic.x}));
+      },
+      [&] {
+        G2 = Utils::spkron(
+            Utils::spkron(Io, Gradient(k, n, dy, Periodic{periodic.y})), Im);
+      },
+      [&] {
+        G3 = Utils::spkron(
+            Utils::spkron(Gradient(k, o, dz, Periodic{periodic.z}), In), Im);
+      },
+  });
+
+  *this = Utils::spjoin_cols(Utils::spjoin_cols(G1, G2), G3);
+}
+
 // Returns weights
 vec Gradient::getP() { return P; }
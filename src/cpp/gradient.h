@@ -62,6 +62,51 @@ public:
    */  
   Gradient(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz);
 
+  /**
+   * @brief 1-D Periodic Mimetic Gradient Constructor
+   *
+   * Returns the m by m circulant operator from cell centers to the faces
+   * x = i*dx, i = 0, ..., m-1, where face 0 is also face m.
+   *
+   * @param k Order of accuracy
+   * @param m Number of cells
+   * @param dx Spacing between cells
+   * @param periodic Periodicity, only x is used. Periodic{false} gives the
+   * operator of the 1-D constructor without it
+   */
+  Gradient(u16 k, u32 m, Real dx, Periodic periodic);
+
+  /**
+   * @brief 2-D Mimetic Gradient Constructor, periodic along some directions
+   *
+   * A periodic direction has m (n) cell centers as unknowns and no
+   * boundary points; a non-periodic one has m+2 (n+2) as in the 2-D
+   * constructor. Unknowns are ordered with x running fastest.
+   *
+   * @param k Order of accuracy
+   * @param m Number of cells in x-direction
+   * @param n Number of cells in y-direction
+   * @param dx Spacing between cells in x-direction
+   * @param dy Spacing between cells in y-direction
+   * @param periodic Periodicity in x and y, e.g. Periodic{true, false}
+   */
+  Gradient(u16 k, u32 m, u32 n, Real dx, Real dy, Periodic periodic);
+
+  /**
+   * @brief 3-D Mimetic Gradient Constructor, periodic along some directions
+   *
+   * @param k Order of accuracy
+   * @param m Number of cells in x-direction
+   * @param n Number of cells in y-direction
+   * @param o Number of cells in z-direction
+   * @param dx Spacing between cells in x-direction
+   * @param dy Spacing between cells in y-direction
+   * @param dz Spacing between cells in z-direction
+   * @param periodic Periodicity in x, y and z
+   */
+  Gradient(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz,
+         Periodic periodic);
+
 
   /**
    * @brief Returns the weights used in the Mimeitc Gradient Operators.
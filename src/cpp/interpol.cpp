@@ -31,9 +31,6 @@ Interpol::Interpol(u32 m, Real c) : sp_mat(m + 1, m + 2) {
 
 // 2-D Constructor
 Interpol::Interpol(u32 m, u32 n, Real c1, Real c2) {
-  Interpol Ix(m, c1);
-  Interpol Iy(n, c2);
-
   sp_mat Im = speye(m + 2, m + 2);
   sp_mat In = speye(n + 2, n + 2);
 
@@ -42,8 +39,12 @@ Interpol::Interpol(u32 m, u32 n, Real c1, Real c2) {
   In.shed_row(0);
   In.shed_row(n);
 
-  sp_mat I1 = Utils::spkron(In, Ix);
-  sp_mat I2 = Utils::spkron(Iy, Im);
+  // The blocks are independent, each task builds its own 1-D operator
+  sp_mat I1, I2;
+  Utils::run_tasks({
+      [&] { I1 = Utils::spkron(In, Interpol(m, c1)); },
+      [&] { I2 = Utils::spkron(Interpol(n, c2), Im); },
+  });
 
   // Dimensions = 2*m*n+m+n, (m+2)*(n+2)
   if (m != n)
@@ -58,10 +59,6 @@ Interpol::Interpol(u32 m, u32 n, Real c1, Real c2) {
 
 // 3-D Constructor
 Interpol::Interpol(u32 m, u32 n, u32 o, Real c1, Real c2, Real c3) {
-  Interpol Ix(m, c1);
-  Interpol Iy(n, c2);
-  Interpol Iz(o, c3);
-
   sp_mat Im = speye(m + 2, m + 2);
   sp_mat In = speye(n + 2, n + 2);
   sp_mat Io = speye(o + 2, o + 2);
@@ -73,9 +70,13 @@ Interpol::Interpol(u32 m, u32 n, u32 o, Real c1, Real c2, Real c3) {
   Io.shed_row(0);
   Io.shed_row(o);
 
-  sp_mat I1 = Utils::spkron(Utils::spkron(Io, In), Ix);
-  sp_mat I2 = Utils::spkron(Utils::spkron(Io, Iy), Im);
-  sp_mat I3 = Utils::spkron(Utils::spkron(Iz, In), Im);
+  // The blocks are independent, each task builds its own 1-D operator
+  sp_mat I1, I2, I3;
+  Utils::run_tasks({
+      [&] { I1 = Utils::spkron(Utils::spkron(Io, In), Interpol(m, c1)); },
+      [&] { I2 = Utils::spkron(Utils::spkron(Io, Interpol(n, c2)), Im); },
+      [&] { I3 = Utils::spkron(Utils::spkron(Interpol(o, c3), In), Im); },
+  });
 
   // Dimensions = 3*m*n*o+m*n+m*o+n*o, (m+2)*(n+2)*(o+2)
   if ((m != n) || (n != o))
@@ -110,27 +111,27 @@ Interpol::Interpol(bool type, u32 m, Real c) : sp_mat(m + 2, m + 1) {
 
 // 2-D Constructor for second type
 Interpol::Interpol(bool type, u32 m, u32 n, Real c1, Real c2) {
-  Interpol Ix(true, m, c1);
-  Interpol Iy(true, n, c2);
-
   sp_mat Im(m + 2, m);
   Im.submat(1, 0, m, m - 1) = speye(m, m);
 
   sp_mat In(n + 2, n);
   In.submat(1, 0, n, n - 1) = speye(n, n);
 
-  sp_mat Sx = Utils::spkron(In, Ix);
-  sp_mat Sy = Utils::spkron(Iy, Im);
+  // Shared by the tasks below, so no lazy update may be pending
+  Im.sync();
+  In.sync();
+
+  sp_mat Sx, Sy;
+  Utils::run_tasks({
+      [&] { Sx = Utils::spkron(In, Interpol(true, m, c1)); },
+      [&] { Sy = Utils::spkron(Interpol(true, n, c2), Im); },
+  });
 
   *this = Utils::spjoin_rows(Sx, Sy);
 }
 
 // 3-D Constructor for second type
 Interpol::Interpol(bool type, u32 m, u32 n, u32 o, Real c1, Real c2, Real c3) {
-  Interpol Ix(true, m, c1);
-  Interpol Iy(true, n, c2);
-  Interpol Iz(true, o, c3);
-
   sp_mat Im(m + 2, m);
   Im.submat(1, 0, m, m - 1) = speye(m, m);
 
@@ -140,9 +141,17 @@ Interpol::Interpol(bool type, u32 m, u32 n, u32 o, Real c1, Real c2, Real c3) {
   sp_mat Io(o + 2, o);
   Io.submat(1, 0, o, o - 1) = speye(o, o);
 
-  sp_mat Sx = Utils::spkron(Utils::spkron(Io, In), Ix);
-  sp_mat Sy = Utils::spkron(Utils::spkron(Io, Iy), Im);
-  sp_mat Sz = Utils::spkron(Utils::spkron(Iz, In), Im);
+  // Shared by the tasks below, so no lazy update may be pending
+  Im.sync();
+  In.sync();
+  Io.sync();
+
+  sp_mat Sx, Sy, Sz;
+  Utils::run_tasks({
+      [&] { Sx = Utils::spkron(Utils::spkron(Io, In), Interpol(true, m, c1)); },
+      [&] { Sy = Utils::spkron(Utils::spkron(Io, Interpol(true, n, c2)), Im); },
+      [&] { Sz = Utils::spkron(Utils::spkron(Interpol(true, o, c3), In), Im); },
+  });
 
   *this = Utils::spjoin_rows(Utils::spjoin_rows(Sx, Sy), Sz);
 }
@@ -28,18 +28,59 @@ Laplacian::Laplacian(u16 k, u32 m, Real dx) {
 
 // 2-D Constructor
 Laplacian::Laplacian(u16 k, u32 m, u32 n, Real dx, Real dy) {
-  Divergence div(k, m, n, dx, dy);
-  Gradient grad(k, m, n, dx, dy);
+  // Divergence and Gradient are independent, build them concurrently
+  sp_mat div, grad;
+  Utils::run_tasks({
+      [&] { div = Divergence(k, m, n, dx, dy); },
+      [&] { grad = Gradient(k, m, n, dx, dy); },
+  });
 
   // Dimensions = (m+2)*(n+2), (m+2)*(n+2)
-  *this = (sp_mat)div * (sp_mat)grad;
+  *this = div * grad;
 }
 
 // 3-D Constructor
 Laplacian::Laplacian(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz) {
-  Divergence div(k, m, n, o, dx, dy, dz);
-  Gradient grad(k, m, n, o, dx, dy, dz);
+  // Divergence and Gradient are independent, build them concurrently
+  sp_mat div, grad;
+  Utils::run_tasks({
+      [&] { div = Divergence(k, m, n, o, dx, dy, dz); },
+      [&] { grad = Gradient(k, m, n, o, dx, dy, dz); },
+  });
 
   // Dimensions = (m+2)*(n+2)*(o+2), (m+2)*(n+2)*(o+2)
+  *this = div * grad;
+}
+
+// 1-D Periodic Constructor
+Laplacian::Laplacian(u16 k, u32 m, Real dx, Periodic periodic) {
+  Divergence div(k, m, dx, periodic);
+  Gradient grad(k, m, dx, periodic);
+
+  // Dimensions = m, m if periodic, else m+2, m+2
   *this = (sp_mat)div * (sp_mat)grad;
 }
+
+// 2-D Constructor, periodic along some directions
+Laplacian::Laplacian(u16 k, u32 m, u32 n, Real dx, Real dy,
+                     Periodic periodic) {
+  sp_mat div, grad;
+  Utils::run_tasks({
+      [&] { div = Divergence(k, m, n, dx, dy, periodic); },
+      [&] { grad = Gradient(k, m, n, dx, dy, periodic); },
+  });
+
+  *this = div * grad;
+}
+
+// 3-D Constructor, periodic along some directions
+Laplacian::Laplacian(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz,
+                     Periodic periodic) {
+  sp_mat div, grad;
+  Utils::run_tasks({
+      [&] { div = Divergence(k, m, n, o, dx, dy, dz, periodic); },
+      [&] { grad = Gradient(k, m, n, o, dx, dy, dz, periodic); },
+  });
+
+  *this = div * grad;
+}
@@ -60,6 +60,51 @@ public:
    * @param dz Spacing between cells in z-direction
    */  
   Laplacian(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz);
+
+  /**
+   * @brief 1-D Periodic Mimetic Laplacian Constructor
+   *
+   * Returns the m by m circulant operator on the cell centers, which are
+   * the only unknowns since the boundary points coincide.
+   *
+   * @param k Order of accuracy
+   * @param m Number of cells
+   * @param dx Spacing between cells
+   * @param periodic Periodicity, only x is used. Periodic{false} gives the
+   * operator of the 1-D constructor without it
+   */
+  Laplacian(u16 k, u32 m, Real dx, Periodic periodic);
+
+  /**
+   * @brief 2-D Mimetic Laplacian Constructor, periodic along some directions
+   *
+   * A periodic direction has m (n) cell centers as unknowns and no
+   * boundary points; a non-periodic one has m+2 (n+2) as in the 2-D
+   * constructor. Unknowns are ordered with x running fastest.
+   *
+   * @param k Order of accuracy
+   * @param m Number of cells in x-direction
+   * @param n Number of cells in y-direction
+   * @param dx Spacing between cells in x-direction
+   * @param dy Spacing between cells in y-direction
+   * @param periodic Periodicity in x and y, e.g. Periodic{true, false}
+   */
+  Laplacian(u16 k, u32 m, u32 n, Real dx, Real dy, Periodic periodic);
+
+  /**
+   * @brief 3-D Mimetic Laplacian Constructor, periodic along some directions
+   *
+   * @param k Order of accuracy
+   * @param m Number of cells in x-direction
+   * @param n Number of cells in y-direction
+   * @param o Number of cells in z-direction
+   * @param dx Spacing between cells in x-direction
+   * @param dy Spacing between cells in y-direction
+   * @param dz Spacing between cells in z-direction
+   * @param periodic Periodicity in x, y and z
+   */
+  Laplacian(u16 k, u32 m, u32 n, u32 o, Real dx, Real dy, Real dz,
+          Periodic periodic);
 };
 
 #endif // LAPLACIAN_H
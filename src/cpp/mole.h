@@ -17,12 +17,19 @@
 #define MOLE_H
 
 #include "divergence.h"
+#include "eigensolver.h"
+#include "expression.h"
+#include "factorization.h"
+#include "fftsolver.h"
 #include "gradient.h"
 #include "interpol.h"
 #include "laplacian.h"
 #include "mixedbc.h"
+#include "newtonkrylov.h"
 #include "operators.h"
+#include "ordering.h"
 #include "robinbc.h"
 #include "utils.h"
+#include "variablelaplacian.h"
 
 #endif // MOLE_H
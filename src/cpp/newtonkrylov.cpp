@@ -0,0 +1,191 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
+*/
+
+/*
+ * @file newtonkrylov.cpp
+ *
+ * @brief Jacobian-free Newton-Krylov solver for nonlinear mimetic problems
+ *
+ * @date 2026/10/19
+ */
+
+#include "newtonkrylov.h"
+#include <algorithm>
+#include <cmath>
+#include <limits>
+
+// Sufficient decrease of the line search, ||F(x + s dx)|| <= (1 - a s) ||F||
+static const Real armijo = 1e-4;
+
+NewtonKrylov::NewtonKrylov(const Residual &F) : F(F) {}
+
+NewtonKrylov::NewtonKrylov(const Residual &F, const sp_mat &P) : F(F) {
+  set_preconditioner(P);
+}
+
+void NewtonKrylov::set_preconditioner(const sp_mat &P) { this->P.factorize(P); }
+
+void NewtonKrylov::set_monitor(const Monitor &monitor) {
+  this->monitor = monitor;
+}
+
+vec NewtonKrylov::precondition(const vec &v) const {
+  return P.factorized() ? P.solve(v) : v;
+}
+
+// Restarted, right preconditioned GMRES for J dx = -F(x)
+u32 NewtonKrylov::gmres(const vec &x, const vec &Fx, vec &dx) const {
+  const u32 n = x.n_elem;
+  const Real h_scale =
+      std::sqrt(std::numeric_limits<Real>::epsilon()) * (1.0 + norm(x));
+
+  // Finite difference Jacobian-vector product
+  auto jv = [&](const vec &v) -> vec {
+    const Real v_norm = norm(v);
+    if (v_norm == 0)
+      return vec(n, fill::zeros);
+    const Real h = h_scale / v_norm;
+    return (F(x + h * v) - Fx) / h;
+  };
+
+  const vec b = -Fx;
+  const Real target = eta * norm(b);
+
+  dx.zeros(n);
+  vec r = b;
+  u32 its = 0;
+  bool breakdown = false;
+
+  while (its < max_linear_iterations && !breakdown) {
+    const Real beta = norm(r);
+    if (beta <= target)
+      break;
+
+    mat V(n, restart + 1, fill::zeros);
+    mat H(restart + 1, restart, fill::zeros);
+    vec cs(restart, fill::zeros), sn(restart, fill::zeros);
+    vec g(restart + 1, fill::zeros);
+
+    V.col(0) = r / beta;
+    g(0) = beta;
+
+    u32 j = 0;
+    bool lucky = false;
+    while (j < restart && its < max_linear_iterations) {
+      vec w = jv(precondition(V.col(j)));
+      const Real w_norm = norm(w);
+
+      // Modified Gram-Schmidt
+      for (u32 i = 0; i <= j; ++i) {
+        H(i, j) = dot(w, V.col(i));
+        w -= H(i, j) * V.col(i);
+      }
+      H(j + 1, j) = norm(w);
+
+      // Lucky breakdown, w is already in the Krylov space and the cycle
+      // ends with the exact least squares solution
+      lucky = H(j + 1, j) <= std::numeric_limits<Real>::epsilon() * w_norm;
+      if (lucky)
+        H(j + 1, j) = 0;
+      else
+        V.col(j + 1) = w / H(j + 1, j);
+
+      // Givens rotations keep H upper triangular
+      for (u32 i = 0; i < j; ++i) {
+        const Real t = cs(i) * H(i, j) + sn(i) * H(i + 1, j);
+        H(i + 1, j) = -sn(i) * H(i, j) + cs(i) * H(i + 1, j);
+        H(i, j) = t;
+      }
+      const Real d = std::hypot(H(j, j), H(j + 1, j));
+      if (d == 0) {
+        // H is singular, keep the solution of the first j columns
+        breakdown = true;
+        break;
+      }
+      cs(j) = H(j, j) / d;
+      sn(j) = H(j + 1, j) / d;
+      H(j, j) = d;
+      H(j + 1, j) = 0;
+      g(j + 1) = -sn(j) * g(j);
+      g(j) = cs(j) * g(j);
+
+      ++j;
+      ++its;
+      if (lucky || std::abs(g(j)) <= target)
+        break;
+    }
+
+    if (j > 0) {
+      vec y = arma::solve(trimatu(H.submat(0, 0, j - 1, j - 1)), g.head(j));
+      dx += precondition(V.cols(0, j - 1) * y);
+    }
+
+    // The true residual, the FD products make the recurrence inexact
+    r = b - jv(dx);
+  }
+
+  return its;
+}
+
+bool NewtonKrylov::solve(vec &x) {
+  iterations = 0;
+  linear_iterations = 0;
+  residual_norms.clear();
+  status = Status::Converged;
+
+  vec Fx = F(x);
+  Real f_norm = norm(Fx);
+  const Real target = std::max(atol, rtol * f_norm);
+
+  residual_norms.push_back(f_norm);
+  if (monitor)
+    monitor(0, f_norm, 0, 0);
+
+  while (f_norm > target) {
+    if (iterations == max_iterations) {
+      status = Status::MaxIterations;
+      return false;
+    }
+
+    vec dx;
+    const u32 its = gmres(x, Fx, dx);
+
+    // Backtracking line search on ||F||
+    Real step = 1.0;
+    vec x_new = x + dx;
+    vec F_new = F(x_new);
+    Real new_norm = norm(F_new);
+    u32 backtracks = 0;
+    while (new_norm > (1.0 - armijo * step) * f_norm) {
+      if (backtracks++ == max_backtracks) {
+        // The step is rejected, x and its residual are kept
+        ++iterations;
+        linear_iterations += its;
+        residual_norms.push_back(f_norm);
+        if (monitor)
+          monitor(iterations, f_norm, its, 0);
+        status = Status::LineSearchFailure;
+        return false;
+      }
+      step /= 2;
+      x_new = x + step * dx;
+      F_new = F(x_new);
+      new_norm = norm(F_new);
+    }
+
+    x = x_new;
+    Fx = F_new;
+    f_norm = new_norm;
+
+    ++iterations;
+    linear_iterations += its;
+    residual_norms.push_back(f_norm);
+    if (monitor)
+      monitor(iterations, f_norm, its, step);
+  }
+
+  return true;
+}
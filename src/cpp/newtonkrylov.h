@@ -0,0 +1,118 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
+*/
+
+/*
+ * @file newtonkrylov.h
+ *
+ * @brief Jacobian-free Newton-Krylov solver for nonlinear mimetic problems
+ *
+ * @date 2026/10/19
+ */
+
+#ifndef NEWTONKRYLOV_H
+#define NEWTONKRYLOV_H
+
+#include "factorization.h"
+#include <functional>
+#include <vector>
+
+/**
+ * @brief Solves F(x) = 0 with Newton's method, GMRES and a line search
+ *
+ * The Jacobian is never formed: GMRES only needs J v, which is
+ * approximated by the finite difference (F(x + h v) - F(x)) / h. The
+ * residual is any function built from the mimetic operators, e.g. a
+ * backward Euler step of a nonlinear diffusion problem,
+ * F(u) = u - u_old - dt * D * (K(u) % (G * u)). A sparse matrix close to
+ * the Jacobian, typically the linear Laplacian + BC (or I - dt * (L + BC)),
+ * can be given as a right preconditioner. It is factorized once and reused
+ * by every linear iteration of every Newton step.
+ */
+class NewtonKrylov {
+
+public:
+  using Residual = std::function<vec(const vec &)>;
+
+  /**
+   * @brief Called after every Newton step with the iteration, the norm of
+   * the residual, the GMRES iterations of the step and the line search step
+   *
+   * A step rejected by the line search is reported with a step of 0 and the
+   * residual of the unchanged x.
+   */
+  using Monitor = std::function<void(u32, Real, u32, Real)>;
+
+  /**
+   * @brief Outcome of the last solve
+   */
+  enum class Status {
+    Converged,         ///< The residual reached the tolerance
+    MaxIterations,     ///< max_iterations Newton steps were taken
+    LineSearchFailure  ///< No sufficient decrease within max_backtracks
+  };
+
+  /**
+   * @brief Unpreconditioned solver
+   *
+   * @param F the nonlinear residual
+   */
+  explicit NewtonKrylov(const Residual &F);
+
+  /**
+   * @brief Preconditioned solver
+   *
+   * @param F the nonlinear residual
+   * @param P an approximation of the Jacobian, e.g. Laplacian + BC
+   */
+  NewtonKrylov(const Residual &F, const sp_mat &P);
+
+  /**
+   * @brief Factorizes a new preconditioner, e.g. when dt changes
+   *
+   * @param P an approximation of the Jacobian
+   */
+  void set_preconditioner(const sp_mat &P);
+
+  /**
+   * @brief Sets a callback to monitor the convergence
+   *
+   * @param monitor the callback, see Monitor
+   */
+  void set_monitor(const Monitor &monitor);
+
+  /**
+   * @brief Solves F(x) = 0
+   *
+   * @param x the initial guess, overwritten by the solution
+   *
+   * @returns true when ||F(x)|| <= max(atol, rtol * ||F(x0)||), otherwise
+   * status tells why the solve stopped
+   */
+  bool solve(vec &x);
+
+  Real rtol = 1e-8;        ///< Relative tolerance of the nonlinear residual
+  Real atol = 1e-12;       ///< Absolute tolerance of the nonlinear residual
+  u32 max_iterations = 50; ///< Maximum number of Newton steps
+  Real eta = 1e-4;         ///< Relative tolerance of each GMRES solve
+  u32 restart = 30;        ///< GMRES restart length
+  u32 max_linear_iterations = 300; ///< Maximum GMRES iterations per step
+  u32 max_backtracks = 10; ///< Maximum step halvings of the line search
+
+  u32 iterations = 0;        ///< Newton steps taken by the last solve
+  u32 linear_iterations = 0; ///< Total GMRES iterations of the last solve
+  std::vector<Real> residual_norms; ///< ||F(x)|| after every Newton step
+  Status status = Status::Converged; ///< Outcome of the last solve
+
+private:
+  Residual F;
+  Factorization P;
+  Monitor monitor;
+
+  vec precondition(const vec &v) const;
+  u32 gmres(const vec &x, const vec &Fx, vec &dx) const;
+};
+
+#endif // NEWTONKRYLOV_H
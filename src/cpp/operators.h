@@ -14,11 +14,18 @@
 #ifndef OPERATORS_H
 #define OPERATORS_H
 
+#include "expression.h"
 #include "interpol.h"
 #include "laplacian.h"
 #include "mixedbc.h"
 #include "robinbc.h"
+#include <type_traits>
+#include <utility>
 
+// Compositions of operators are assembled, as direct solvers need them.
+// Start from an OperatorExpression, e.g. OperatorExpression(D) * G, to
+// keep them unevaluated. Named operators are referred to, temporaries are
+// moved into the expression.
 inline sp_mat operator*(const Divergence &div, const Gradient &grad) {
   return (sp_mat)div * (sp_mat)grad;
 }
@@ -31,6 +38,68 @@ inline sp_mat operator+(const Laplacian &lap, const MixedBC &bc) {
   return (sp_mat)lap + (sp_mat)bc;
 }
 
+inline OperatorExpression operator+(const OperatorExpression &E,
+                                    const sp_mat &A) {
+  return E + OperatorExpression(A);
+}
+
+inline OperatorExpression operator+(const sp_mat &A,
+                                    const OperatorExpression &E) {
+  return OperatorExpression(A) + E;
+}
+
+inline OperatorExpression operator+(const OperatorExpression &E, sp_mat &&A) {
+  return E + OperatorExpression(std::move(A));
+}
+
+inline OperatorExpression operator+(sp_mat &&A, const OperatorExpression &E) {
+  return OperatorExpression(std::move(A)) + E;
+}
+
+inline OperatorExpression operator-(const OperatorExpression &E,
+                                    const sp_mat &A) {
+  return E - OperatorExpression(A);
+}
+
+inline OperatorExpression operator-(const sp_mat &A,
+                                    const OperatorExpression &E) {
+  return OperatorExpression(A) - E;
+}
+
+inline OperatorExpression operator-(const OperatorExpression &E, sp_mat &&A) {
+  return E - OperatorExpression(std::move(A));
+}
+
+inline OperatorExpression operator-(sp_mat &&A, const OperatorExpression &E) {
+  return OperatorExpression(std::move(A)) - E;
+}
+
+inline OperatorExpression operator*(const OperatorExpression &E,
+                                    const sp_mat &A) {
+  return E * OperatorExpression(A);
+}
+
+inline OperatorExpression operator*(const sp_mat &A,
+                                    const OperatorExpression &E) {
+  return OperatorExpression(A) * E;
+}
+
+inline OperatorExpression operator*(const OperatorExpression &E, sp_mat &&A) {
+  return E * OperatorExpression(std::move(A));
+}
+
+inline OperatorExpression operator*(sp_mat &&A, const OperatorExpression &E) {
+  return OperatorExpression(std::move(A)) * E;
+}
+
+inline OperatorExpression operator*(Real scale, const OperatorExpression &E) {
+  return E * scale;
+}
+
+inline vec operator*(const OperatorExpression &E, const vec &v) {
+  return E.apply(v);
+}
+
 inline vec operator*(const Divergence &div, const vec &v) {
   return (sp_mat)div * v;
 }
@@ -47,4 +116,57 @@ inline vec operator*(const Interpol &I, const vec &v) {
   return (sp_mat)I * v; 
 }
 
+inline vec operator*(const RobinBC &bc, const vec &v) {
+  return (sp_mat)bc * v;
+}
+
+inline vec operator*(const MixedBC &bc, const vec &v) {
+  return (sp_mat)bc * v;
+}
+
+// Batched apply to a mat with one column per field (SpMM, see Utils::spmm).
+// Taking Base also catches Armadillo expressions such as V % (I * C), which
+// would otherwise convert to both vec and mat; column expressions stay vec.
+template <typename T1>
+using apply_result = typename std::conditional<T1::is_col, vec, mat>::type;
+
+template <typename T1>
+inline apply_result<T1> operator*(const OperatorExpression &E,
+                                  const Base<Real, T1> &X) {
+  return E.apply(mat(X.get_ref()));
+}
+
+template <typename T1>
+inline apply_result<T1> operator*(const Divergence &div,
+                                  const Base<Real, T1> &X) {
+  return Utils::spmm(div, X.get_ref());
+}
+
+template <typename T1>
+inline apply_result<T1> operator*(const Gradient &grad,
+                                  const Base<Real, T1> &X) {
+  return Utils::spmm(grad, X.get_ref());
+}
+
+template <typename T1>
+inline apply_result<T1> operator*(const Laplacian &lap,
+                                  const Base<Real, T1> &X) {
+  return Utils::spmm(lap, X.get_ref());
+}
+
+template <typename T1>
+inline apply_result<T1> operator*(const Interpol &I, const Base<Real, T1> &X) {
+  return Utils::spmm(I, X.get_ref());
+}
+
+template <typename T1>
+inline apply_result<T1> operator*(const RobinBC &bc, const Base<Real, T1> &X) {
+  return Utils::spmm(bc, X.get_ref());
+}
+
+template <typename T1>
+inline apply_result<T1> operator*(const MixedBC &bc, const Base<Real, T1> &X) {
+  return Utils::spmm(bc, X.get_ref());
+}
+
 #endif // OPERATORS_H
@@ -0,0 +1,222 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
+*/
+
+/*
+ * @file ordering.cpp
+ *
+ * @brief Bandwidth and fill reducing orderings of operators and fields
+ *
+ * @date 2026/10/19
+ */
+
+#include "ordering.h"
+#include <algorithm>
+#include <cassert>
+#include <vector>
+
+Ordering::Ordering(const uvec &perm) : p(perm), ip(perm.n_elem) {
+  // regspace(0, n - 1) would wrap around for n = 0
+  if (p.is_empty())
+    return;
+  ip.elem(p) = regspace<uvec>(0, p.n_elem - 1);
+  assert(all(p.elem(ip) == regspace<uvec>(0, p.n_elem - 1)));
+}
+
+Ordering Ordering::rcm(const sp_mat &A) {
+  assert(A.n_rows == A.n_cols);
+  const uword n = A.n_rows;
+
+  // Graph of the symmetrized pattern
+  const sp_mat S = spones(A) + spones(sp_mat(A.t()));
+  S.sync();
+
+  std::vector<uword> degree(n);
+  for (uword j = 0; j < n; ++j)
+    degree[j] = S.col_ptrs[j + 1] - S.col_ptrs[j];
+
+  std::vector<char> placed(n, 0);
+  std::vector<uword> mark(n, 0);
+  uword stamp = 0;
+
+  // Breadth-first level structure of the unplaced nodes reachable from
+  // root, returns its depth and the nodes of the last level
+  auto levels = [&](uword root, std::vector<uword> &last) {
+    ++stamp;
+    mark[root] = stamp;
+    std::vector<uword> level{root}, next;
+    uword depth = 0;
+    while (true) {
+      next.clear();
+      for (uword u : level)
+        for (uword q = S.col_ptrs[u]; q < S.col_ptrs[u + 1]; ++q) {
+          const uword v = S.row_indices[q];
+          if (!placed[v] && mark[v] != stamp) {
+            mark[v] = stamp;
+            next.push_back(v);
+          }
+        }
+      if (next.empty()) {
+        last = level;
+        return depth;
+      }
+      level.swap(next);
+      ++depth;
+    }
+  };
+
+  auto by_degree = [&](uword a, uword b) {
+    return degree[a] < degree[b] || (degree[a] == degree[b] && a < b);
+  };
+
+  std::vector<uword> order;
+  order.reserve(n);
+
+  // One Cuthill-McKee sweep per connected component
+  for (uword start = 0; start < n; ++start) {
+    if (placed[start])
+      continue;
+
+    // Pseudo-peripheral root (George and Liu)
+    uword root = start;
+    std::vector<uword> last, candidate_last;
+    uword depth = levels(root, last);
+    while (true) {
+      const uword candidate =
+          *std::min_element(last.begin(), last.end(), by_degree);
+      const uword candidate_depth = levels(candidate, candidate_last);
+      if (candidate_depth <= depth)
+        break;
+      root = candidate;
+      depth = candidate_depth;
+      last.swap(candidate_last);
+    }
+
+    std::size_t head = order.size();
+    order.push_back(root);
+    placed[root] = 1;
+    std::vector<uword> neighbors;
+    while (head < order.size()) {
+      const uword u = order[head++];
+      neighbors.clear();
+      for (uword q = S.col_ptrs[u]; q < S.col_ptrs[u + 1]; ++q) {
+        const uword v = S.row_indices[q];
+        if (!placed[v]) {
+          placed[v] = 1;
+          neighbors.push_back(v);
+        }
+      }
+      std::sort(neighbors.begin(), neighbors.end(), by_degree);
+      order.insert(order.end(), neighbors.begin(), neighbors.end());
+    }
+  }
+
+  std::reverse(order.begin(), order.end());
+  return Ordering(uvec(order));
+}
+
+// Numbers the box [x0, x1) x [y0, y1) x [z0, z1) of an nx by ny grid
+static void dissect(u32 x0, u32 x1, u32 y0, u32 y1, u32 z0, u32 z1, u32 nx,
+                    u32 ny, u32 width, std::vector<uword> &order) {
+  const u32 lo[3] = {x0, y0, z0};
+  const u32 hi[3] = {x1, y1, z1};
+  const u32 size[3] = {x1 - x0, y1 - y0, z1 - z0};
+  const int d = std::max_element(size, size + 3) - size;
+
+  // Small boxes, or boxes too thin to split, are numbered as they are
+  const uword leaf = 64;
+  if (uword(size[0]) * size[1] * size[2] <= leaf || size[d] < width + 2) {
+    for (u32 z = z0; z < z1; ++z)
+      for (u32 y = y0; y < y1; ++y)
+        for (u32 x = x0; x < x1; ++x)
+          order.push_back(x + uword(nx) * (y + uword(ny) * z));
+    return;
+  }
+
+  const u32 mid = lo[d] + (size[d] - width) / 2;
+  u32 left_hi[3] = {x1, y1, z1}, right_lo[3] = {x0, y0, z0};
+  u32 sep_lo[3] = {x0, y0, z0}, sep_hi[3] = {x1, y1, z1};
+  left_hi[d] = mid;
+  right_lo[d] = mid + width;
+  sep_lo[d] = mid;
+  sep_hi[d] = mid + width;
+
+  dissect(lo[0], left_hi[0], lo[1], left_hi[1], lo[2], left_hi[2], nx, ny,
+          width, order);
+  dissect(right_lo[0], hi[0], right_lo[1], hi[1], right_lo[2], hi[2], nx, ny,
+          width, order);
+
+  // The separator goes last
+  for (u32 z = sep_lo[2]; z < sep_hi[2]; ++z)
+    for (u32 y = sep_lo[1]; y < sep_hi[1]; ++y)
+      for (u32 x = sep_lo[0]; x < sep_hi[0]; ++x)
+        order.push_back(x + uword(nx) * (y + uword(ny) * z));
+}
+
+Ordering Ordering::nested_dissection(u32 nx, u32 ny, u32 nz, u32 width) {
+  assert(width > 0);
+  std::vector<uword> order;
+  order.reserve(uword(nx) * ny * nz);
+  dissect(0, nx, 0, ny, 0, nz, nx, ny, width, order);
+  return Ordering(uvec(order));
+}
+
+Ordering Ordering::morton(u32 nx, u32 ny, u32 nz) {
+  const uword n = uword(nx) * ny * nz;
+  uvec codes(n);
+
+  // Interleaves the bits of x, y and z
+  for (u32 z = 0; z < nz; ++z)
+    for (u32 y = 0; y < ny; ++y)
+      for (u32 x = 0; x < nx; ++x) {
+        uword code = 0;
+        for (u32 b = 0; b < 21; ++b) {
+          code |= uword((x >> b) & 1) << (3 * b);
+          code |= uword((y >> b) & 1) << (3 * b + 1);
+          code |= uword((z >> b) & 1) << (3 * b + 2);
+        }
+        codes(x + uword(nx) * (y + uword(ny) * z)) = code;
+      }
+
+  return Ordering(stable_sort_index(codes));
+}
+
+sp_mat Ordering::permute_operator(const sp_mat &A) const {
+  return permute_operator(A, *this);
+}
+
+sp_mat Ordering::permute_operator(const sp_mat &A, const Ordering &cols) const {
+  assert(A.n_rows == p.n_elem && A.n_cols == cols.p.n_elem);
+
+  umat locations(2, A.n_nonzero);
+  vec values(A.n_nonzero);
+  uword q = 0;
+  for (auto it = A.begin(); it != A.end(); ++it, ++q) {
+    locations(0, q) = ip(it.row());
+    locations(1, q) = cols.ip(it.col());
+    values(q) = *it;
+  }
+
+  return sp_mat(locations, values, A.n_rows, A.n_cols, true);
+}
+
+vec Ordering::permute_field(const vec &u) const {
+  assert(u.n_elem == p.n_elem);
+  return u.elem(p);
+}
+
+vec Ordering::restore_field(const vec &u) const {
+  assert(u.n_elem == p.n_elem);
+  return u.elem(ip);
+}
+
+uword Ordering::bandwidth(const sp_mat &A) {
+  uword band = 0;
+  for (auto it = A.begin(); it != A.end(); ++it) {
+    const uword r = it.row(), c = it.col();
+    band = std::max(band, r > c ? r - c : c - r);
+  }
+  return band;
+}
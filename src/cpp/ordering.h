@@ -0,0 +1,131 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
+*/
+
+/*
+ * @file ordering.h
+ *
+ * @brief Bandwidth and fill reducing orderings of operators and fields
+ *
+ * @date 2026/10/19
+ */
+
+#ifndef ORDERING_H
+#define ORDERING_H
+
+#include "utils.h"
+
+/**
+ * @brief A permutation of the unknowns of an operator
+ *
+ * The 2-D and 3-D operators number their unknowns lexicographically (x
+ * fastest), which gives the Laplacian a bandwidth of (m+2)*(n+2) in 3-D.
+ * An Ordering renumbers them, e.g. with reverse Cuthill-McKee for a small
+ * bandwidth (SpMV locality, banded solves), nested dissection for little
+ * LU fill-in, or a Morton curve for cache blocking. The same Ordering
+ * must be applied to an operator and to the fields it acts on, and the
+ * results are permuted back with restore_field():
+ *
+ *     Ordering p = Ordering::rcm(A);
+ *     Factorization lu(p.permute_operator(A), true);
+ *     vec u = p.restore_field(lu.solve(p.permute_field(b)));
+ *
+ * New unknown i is old unknown perm()(i).
+ */
+class Ordering {
+
+public:
+  /**
+   * @brief Ordering from an explicit permutation
+   *
+   * @param perm new unknown i is old unknown perm(i)
+   */
+  explicit Ordering(const uvec &perm);
+
+  /**
+   * @brief Reverse Cuthill-McKee ordering of the graph of A + A'
+   *
+   * @param A a square sparse matrix, e.g. Laplacian + BC
+   */
+  static Ordering rcm(const sp_mat &A);
+
+  /**
+   * @brief Geometric nested dissection of an nx by ny by nz grid
+   *
+   * Each box is split by a plane of separator points normal to its
+   * longest side. Both halves are numbered first, then the separator.
+   *
+   * @param nx number of points along x (m + 2 for a cell-centered field)
+   * @param ny number of points along y
+   * @param nz number of points along z, 1 for 2-D
+   * @param width separator width, k - 1 for a k-th order Laplacian
+   */
+  static Ordering nested_dissection(u32 nx, u32 ny, u32 nz = 1,
+                                    u32 width = 1);
+
+  /**
+   * @brief Morton (Z-order) ordering of an nx by ny by nz grid
+   *
+   * Points close in space get close numbers, recursively in tiles of
+   * 2x2x2, which improves the cache reuse of SpMV.
+   *
+   * @param nx number of points along x
+   * @param ny number of points along y
+   * @param nz number of points along z, 1 for 2-D
+   */
+  static Ordering morton(u32 nx, u32 ny, u32 nz = 1);
+
+  /**
+   * @brief Symmetric permutation P * A * P' of a square operator
+   *
+   * @param A a sparse operator acting on the ordered unknowns
+   */
+  sp_mat permute_operator(const sp_mat &A) const;
+
+  /**
+   * @brief Permutes the rows by this ordering and the columns by another
+   *
+   * @param A a sparse operator, e.g. a Gradient from cells to faces
+   * @param cols the ordering of the unknowns A acts on
+   */
+  sp_mat permute_operator(const sp_mat &A, const Ordering &cols) const;
+
+  /**
+   * @brief Field in the new ordering
+   *
+   * @param u a field in the original ordering
+   */
+  vec permute_field(const vec &u) const;
+
+  /**
+   * @brief Field back in the original ordering
+   *
+   * @param u a field in the new ordering
+   */
+  vec restore_field(const vec &u) const;
+
+  /**
+   * @brief New unknown i is old unknown perm()(i)
+   */
+  const uvec &perm() const { return p; }
+
+  /**
+   * @brief Old unknown i is new unknown inverse()(i)
+   */
+  const uvec &inverse() const { return ip; }
+
+  /**
+   * @brief Largest distance of a nonzero from the diagonal
+   *
+   * @param A a sparse matrix
+   */
+  static uword bandwidth(const sp_mat &A);
+
+private:
+  uvec p;
+  uvec ip;
+};
+
+#endif // ORDERING_H
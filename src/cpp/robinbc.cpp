@@ -30,17 +30,21 @@ RobinBC::RobinBC(u16 k, u32 m, Real dx, Real a, Real b) {
 
 
 RobinBC::RobinBC(u16 k, u32 m, Real dx, u32 n, Real dy, Real a, Real b) {
-  RobinBC Bm(k, m, dx, a, b);
-  RobinBC Bn(k, n, dy, a, b);
-
   sp_mat Im = speye(m + 2, m + 2);
   sp_mat In = speye(n + 2, n + 2);
 
   In.at(0, 0) = 0;
   In.at(n + 1, n + 1) = 0;
 
-  sp_mat BC1 = Utils::spkron(In, Bm);
-  sp_mat BC2 = Utils::spkron(Bn, Im);
+  // Shared by the tasks below, so no lazy update may be pending
+  In.sync();
+
+  // The blocks are independent, each task builds its own 1-D operator
+  sp_mat BC1, BC2;
+  Utils::run_tasks({
+      [&] { BC1 = Utils::spkron(In, RobinBC(k, m, dx, a, b)); },
+      [&] { BC2 = Utils::spkron(RobinBC(k, n, dy, a, b), Im); },
+  });
 
   *this = BC1 + BC2;
 }
@@ -48,10 +52,6 @@ RobinBC::RobinBC(u16 k, u32 m, Real dx, u32 n, Real dy, Real a, Real b) {
 
 RobinBC::RobinBC(u16 k, u32 m, Real dx, u32 n, Real dy, u32 o, Real dz, Real a,
                  Real b) {
-  RobinBC Bm(k, m, dx, a, b);
-  RobinBC Bn(k, n, dy, a, b);
-  RobinBC Bo(k, o, dz, a, b);
-
   sp_mat Im = speye(m + 2, m + 2);
   sp_mat In = speye(n + 2, n + 2);
   sp_mat Io = speye(o + 2, o + 2);
@@ -63,9 +63,23 @@ RobinBC::RobinBC(u16 k, u32 m, Real dx, u32 n, Real dy, u32 o, Real dz, Real a,
   In2.at(0, 0) = 0;
   In2.at(n + 1, n + 1) = 0;
 
-  sp_mat BC1 = Utils::spkron(Utils::spkron(Io, In2), Bm);
-  sp_mat BC2 = Utils::spkron(Utils::spkron(Io, Bn), Im);
-  sp_mat BC3 = Utils::spkron(Utils::spkron(Bo, In), Im);
+  // Shared by the tasks below, so no lazy update may be pending
+  Io.sync();
+  In2.sync();
+
+  // The blocks are independent, each task builds its own 1-D operator
+  sp_mat BC1, BC2, BC3;
+  Utils::run_tasks({
+      [&] {
+        BC1 = Utils::spkron(Utils::spkron(Io, In2), RobinBC(k, m, dx, a, b));
+      },
+      [&] {
+        BC2 = Utils::spkron(Utils::spkron(Io, RobinBC(k, n, dy, a, b)), Im);
+      },
+      [&] {
+        BC3 = Utils::spkron(Utils::spkron(RobinBC(k, o, dz, a, b), In), Im);
+      },
+  });
 
   *this = BC1 + BC2 + BC3;
 }
@@ -16,18 +16,25 @@
  */
 
 #include "utils.h"
+#include <algorithm>
+#include <atomic>
 #include <cassert>
+#include <exception>
+#include <stdexcept>
 
-#ifdef EIGEN
-#include <eigen3/Eigen/SparseLU>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 
-vec Utils::spsolve_eigen(const sp_mat &A, const vec &b) {
+// Threads used to build operator components, 0 is the OpenMP default
+static std::atomic<int> n_construction_threads{0};
+
+#ifdef EIGEN
+// Copies an Armadillo sparse matrix into an Eigen one
+Eigen::SparseMatrix<Real> Utils::to_eigen(const sp_mat &A) {
   Eigen::SparseMatrix<Real> eigen_A(A.n_rows, A.n_cols);
   std::vector<Eigen::Triplet<Real>> triplets;
-  Eigen::SparseLU<Eigen::SparseMatrix<Real>, Eigen::COLAMDOrdering<int>> solver;
-
-  Eigen::VectorXd eigen_x(A.n_rows);
-  triplets.reserve(5 * A.n_rows);
+  triplets.reserve(A.n_nonzero);
 
   auto it = A.begin();
   while (it != A.end()) {
@@ -36,7 +43,14 @@ vec Utils::spsolve_eigen(const sp_mat &A, const vec &b) {
   }
 
   eigen_A.setFromTriplets(triplets.begin(), triplets.end());
-  triplets.clear();
+  return eigen_A;
+}
+
+vec Utils::spsolve_eigen(const sp_mat &A, const vec &b) {
+  Eigen::SparseMatrix<Real> eigen_A = to_eigen(A);
+  EigenLU solver;
+
+  Eigen::VectorXd eigen_x(A.n_rows);
 
   auto b_ = conv_to<std::vector<Real>>::from(b);
   Eigen::Map<Eigen::VectorXd> eigen_b(b_.data(), b_.size());
@@ -47,8 +61,72 @@ vec Utils::spsolve_eigen(const sp_mat &A, const vec &b) {
 
   return vec(eigen_x.data(), eigen_x.size());
 }
+
+mat Utils::spsolve_eigen_multi(const sp_mat &A, const mat &B) {
+  Eigen::SparseMatrix<Real> eigen_A = to_eigen(A);
+  EigenLU solver;
+
+  solver.analyzePattern(eigen_A);
+  solver.factorize(eigen_A);
+  if (solver.info() != Eigen::Success)
+    throw std::runtime_error("spsolve_eigen_multi: the matrix is singular");
+
+  // One blocked triangular solve for all the right-hand sides
+  mat X(A.n_cols, B.n_cols);
+  Eigen::Map<const Eigen::MatrixXd> eigen_B(B.memptr(), B.n_rows, B.n_cols);
+  Eigen::Map<Eigen::MatrixXd> eigen_X(X.memptr(), X.n_rows, X.n_cols);
+  eigen_X = solver.solve(eigen_B);
+
+  return X;
+}
 #endif
 
+mat Utils::spmm(const sp_mat &A, const mat &X) {
+  assert(A.n_cols == X.n_rows);
+
+  A.sync();
+  mat Y(A.n_rows, X.n_cols);
+
+  const uword block = 8;
+  const uword *rows = A.row_indices;
+
+  for (uword j0 = 0; j0 < X.n_cols; j0 += block) {
+    const uword j1 = std::min<uword>(j0 + block, X.n_cols);
+    const uword fields = j1 - j0;
+
+    // Transposed blocks hold the fields of a point contiguously, so each
+    // nonzero of A updates all of them in a single pass over A
+    const mat Xt = X.cols(j0, j1 - 1).t();
+    mat Yt(fields, A.n_rows, fill::zeros);
+
+    // Each thread owns a range of rows of Y, so even a single field is
+    // split between the threads and no update is shared
+#pragma omp parallel
+    {
+      const uword threads = omp_get_num_threads();
+      const uword t = omp_get_thread_num();
+      const uword r0 = A.n_rows * t / threads;
+      const uword r1 = A.n_rows * (t + 1) / threads;
+
+      for (uword c = 0; c < A.n_cols; ++c) {
+        const uword *end = rows + A.col_ptrs[c + 1];
+        const Real *x = Xt.colptr(c);
+        for (const uword *q = std::lower_bound(rows + A.col_ptrs[c], end, r0);
+             q != end && *q < r1; ++q) {
+          const Real v = A.values[q - rows];
+          Real *y = Yt.colptr(*q);
+          for (uword j = 0; j < fields; ++j)
+            y[j] += v * x[j];
+        }
+      }
+    }
+
+    Y.cols(j0, j1 - 1) = Yt.t();
+  }
+
+  return Y;
+}
+
 // Basic implementation of Kronecker product
 /*
 sp_mat Utils::spkron(const sp_mat &A, const sp_mat &B)
@@ -169,6 +247,69 @@ sp_mat Utils::spjoin_cols(const sp_mat &A, const sp_mat &B) {
   return result;
 }
 
+sp_mat Utils::face_cells(u32 m, bool periodic) {
+  if (periodic)
+    return speye(m, m);
+  sp_mat I = speye(m + 2, m + 2);
+  I.shed_row(0);
+  I.shed_row(m);
+  return I;
+}
+
+void Utils::set_construction_threads(int threads) {
+  assert(threads >= 0);
+  n_construction_threads = threads;
+}
+
+int Utils::construction_threads() {
+#ifdef _OPENMP
+  const int threads = n_construction_threads;
+  return threads > 0 ? threads : omp_get_max_threads();
+#else
+  return 1;
+#endif
+}
+
+void Utils::run_tasks(const std::vector<std::function<void()>> &tasks) {
+  const sword n_tasks = tasks.size();
+  std::vector<std::exception_ptr> errors(n_tasks);
+
+  // Exceptions must not escape an OpenMP region
+  auto run = [&](sword i) {
+    try {
+      tasks[i]();
+    } catch (...) {
+      errors[i] = std::current_exception();
+    }
+  };
+
+  const int threads = construction_threads();
+  if (threads < 2 || n_tasks < 2) {
+    for (sword i = 0; i < n_tasks; ++i)
+      run(i);
+  } else {
+#ifdef _OPENMP
+    if (omp_in_parallel()) {
+      for (sword i = 0; i < n_tasks; ++i) {
+#pragma omp task shared(run)
+        run(i);
+      }
+#pragma omp taskwait
+    } else {
+#pragma omp parallel num_threads(threads)
+#pragma omp single
+      for (sword i = 0; i < n_tasks; ++i) {
+#pragma omp task shared(run)
+        run(i);
+      }
+    }
+#endif
+  }
+
+  for (const auto &error : errors)
+    if (error)
+      std::rethrow_exception(error);
+}
 
 void Utils::meshgrid(const vec &x, const vec &y, mat &X, mat &Y) {
   int m = x.n_elem;
@@ -17,10 +17,29 @@
 #define UTILS_H
 
 #include <armadillo>
+#include <functional>
+#include <vector>
+
+#ifdef EIGEN
+#include <eigen3/Eigen/SparseLU>
+#endif
 
 using Real = double;
 using namespace arma;
 
+/**
+ * @brief Periodicity of the x, y and z directions of a domain
+ *
+ * Selects the periodic constructors of the operators, e.g.
+ * Laplacian(k, m, n, dx, dy, Periodic{true, false}). Directions left out
+ * are not periodic.
+ */
+struct Periodic {
+  bool x = false; ///< Whether the domain is periodic in x
+  bool y = false; ///< Whether the domain is periodic in y
+  bool z = false; ///< Whether the domain is periodic in z
+};
+
 /**
  * @brief Utility Functions
  *
@@ -58,6 +77,22 @@ public:
   */  
   static sp_mat spjoin_cols(const sp_mat &A, const sp_mat &B);
 
+  /**
+  * @brief Selects the cells of a direction that carry the faces of the
+  * other directions
+  *
+  * Used to build the multi-dimensional periodic operators. A periodic
+  * direction has m unknowns, all cells. A non-periodic one has m+2, and
+  * its boundary points carry no faces.
+  *
+  * @param m Number of cells
+  * @param periodic Whether the direction is periodic
+  *
+  * @returns the m by m identity if periodic, else the m by m+2 identity
+  * without its boundary columns
+  */
+  static sp_mat face_cells(u32 m, bool periodic);
+
   /**
   * @brief A wrappper for implementing a sparse solve using Eigen from SuperLU.
   *
@@ -68,6 +103,74 @@ public:
   */
   static vec spsolve_eigen(const sp_mat &A, const vec &b);
 
+  /**
+  * @brief A multi-RHS sparse solve using Eigen, one column per field.
+  *
+  * @param A a sparse matrix LHS of AX=B
+  * @param B a matrix whose columns are the RHS of AX=B
+  *
+  * @note A is factorized once and all columns are solved in one blocked
+  * triangular solve.
+  * Without EIGEN, spsolve(A, B) also factorizes once for all columns.
+  */
+  static mat spsolve_eigen_multi(const sp_mat &A, const mat &B);
+
+#ifdef EIGEN
+  /**
+  * @brief The sparse LU factorization used by the Eigen solves
+  */
+  using EigenLU =
+      Eigen::SparseLU<Eigen::SparseMatrix<Real>, Eigen::COLAMDOrdering<int>>;
+
+  /**
+  * @brief Copies an Armadillo sparse matrix into an Eigen one
+  *
+  * @param A a sparse matrix
+  */
+  static Eigen::SparseMatrix<Real> to_eigen(const sp_mat &A);
+#endif
+
+  /**
+  * @brief Sparse times dense product for many fields at once (SpMM)
+  *
+  * The fields are processed in blocks of 8. A is read once per block, and
+  * each nonzero updates all the fields of the block, which are stored
+  * contiguously in a transposed copy of the block. The rows of Y are
+  * split between the threads, so a single field is computed in parallel.
+  *
+  * @param A a sparse matrix
+  * @param X a matrix, one column per field
+  */
+  static mat spmm(const sp_mat &A, const mat &X);
+
+  /**
+  * @brief Sets the number of threads used to build operator components
+  *
+  * The 2-D and 3-D constructors build their per-axis blocks as parallel
+  * tasks, and Laplacian builds its Divergence and Gradient in parallel.
+  *
+  * @param threads number of threads, 0 (default) uses the OpenMP default
+  * and 1 builds the components one after the other
+  */
+  static void set_construction_threads(int threads);
+
+  /**
+  * @brief Number of threads used to build operator components
+  */
+  static int construction_threads();
+
+  /**
+  * @brief Runs independent tasks in parallel and waits for all of them
+  *
+  * When called from a task that is already running in parallel, e.g. a
+  * Gradient built inside a Laplacian, the tasks join the enclosing team
+  * instead of starting a nested one. An exception thrown by a task is
+  * rethrown once all tasks have finished.
+  *
+  * @param tasks the tasks, which must only read shared data
+  */
+  static void run_tasks(const std::vector<std::function<void()>> &tasks);
+
   /**
   * @brief An analog to the MATLAB/Octave 2D meshgrid operation
   *
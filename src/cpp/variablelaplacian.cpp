@@ -0,0 +1,117 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
+*/
+
+/*
+ * @file variablelaplacian.cpp
+ *
+ * @brief Variable-coefficient Laplacian with a fixed sparsity pattern
+ *
+ * @date 2026/10/19
+ */
+
+#include "variablelaplacian.h"
+#include <algorithm>
+#include <cassert>
+#include <tuple>
+#include <vector>
+
+VariableLaplacian::VariableLaplacian(const sp_mat &D, const sp_mat &G,
+                                     const vec &K)
+    : VariableLaplacian(D, G, K, sp_mat(D.n_rows, G.n_cols)) {}
+
+VariableLaplacian::VariableLaplacian(const sp_mat &D, const sp_mat &G,
+                                     const vec &K, const sp_mat &C) {
+  assert(D.n_cols == G.n_rows);
+  assert(C.n_rows == D.n_rows && C.n_cols == G.n_cols);
+
+  // Symbolic product: D(i, f) * G(f, j) contributes to (i, j), so walk the
+  // columns of D together with the columns of G^T (the rows of G)
+  const sp_mat Gt = G.t();
+  D.sync();
+  C.sync();
+
+  struct Entry {
+    uword col, row, face;
+    Real coeff;
+    bool operator<(const Entry &other) const {
+      return std::tie(col, row) < std::tie(other.col, other.row);
+    }
+  };
+  const uword no_face = D.n_cols;
+
+  std::vector<Entry> entries;
+  for (uword f = 0; f < D.n_cols; ++f)
+    for (uword p = D.col_ptrs[f]; p < D.col_ptrs[f + 1]; ++p)
+      for (uword q = Gt.col_ptrs[f]; q < Gt.col_ptrs[f + 1]; ++q)
+        entries.push_back({Gt.row_indices[q], D.row_indices[p], f,
+                           D.values[p] * Gt.values[q]});
+
+  for (uword j = 0; j < C.n_cols; ++j)
+    for (uword p = C.col_ptrs[j]; p < C.col_ptrs[j + 1]; ++p)
+      entries.push_back({j, C.row_indices[p], no_face, C.values[p]});
+
+  std::stable_sort(entries.begin(), entries.end());
+
+  // Compressed pattern, and the contributions grouped by nonzero
+  std::vector<uword> row_indices, col_ptrs(G.n_cols + 1, 0), first;
+  std::vector<uword> face_list;
+  std::vector<Real> coeff_list, constant_list;
+  for (uword e = 0; e < entries.size(); ++e) {
+    const Entry &entry = entries[e];
+    if (e == 0 || entry.col != entries[e - 1].col ||
+        entry.row != entries[e - 1].row) {
+      row_indices.push_back(entry.row);
+      ++col_ptrs[entry.col + 1];
+      first.push_back(face_list.size());
+      constant_list.push_back(0.0);
+    }
+    if (entry.face == no_face) {
+      constant_list.back() += entry.coeff;
+    } else {
+      face_list.push_back(entry.face);
+      coeff_list.push_back(entry.coeff);
+    }
+  }
+  for (uword j = 0; j < G.n_cols; ++j)
+    col_ptrs[j + 1] += col_ptrs[j];
+  first.push_back(face_list.size());
+
+  n_faces = D.n_cols;
+  start = uvec(first);
+  faces = uvec(face_list);
+  coeffs = vec(coeff_list);
+  constant = vec(constant_list);
+
+  // Keep explicit zeros, the pattern must not depend on the values
+  sp_mat::operator=(sp_mat(uvec(row_indices), uvec(col_ptrs),
+                           vec(row_indices.size(), fill::zeros), D.n_rows,
+                           G.n_cols, false));
+
+  refresh(K);
+}
+
+void VariableLaplacian::refresh(const vec &K) {
+  assert(K.n_elem == n_faces);
+  assert(start.n_elem == n_nonzero + 1);
+
+  sync();
+  const sword nnz = n_nonzero;
+  vec vals(nnz);
+
+#pragma omp parallel for
+  for (sword p = 0; p < nnz; ++p) {
+    Real v = constant[p];
+    for (uword q = start[p]; q < start[p + 1]; ++q)
+      v += coeffs[q] * K[faces[q]];
+    vals[p] = v;
+  }
+
+  // Rebuild through the CSC constructor on the same pattern, which keeps
+  // the explicit zeros and resets Armadillo's element cache
+  sp_mat::operator=(sp_mat(uvec(row_indices, n_nonzero),
+                           uvec(col_ptrs, n_cols + 1), vals, n_rows, n_cols,
+                           false));
+}
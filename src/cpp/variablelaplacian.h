@@ -0,0 +1,79 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
+*/
+
+/*
+ * @file variablelaplacian.h
+ *
+ * @brief Variable-coefficient Laplacian with a fixed sparsity pattern
+ *
+ * @date 2026/10/19
+ */
+
+#ifndef VARIABLELAPLACIAN_H
+#define VARIABLELAPLACIAN_H
+
+#include "utils.h"
+
+/**
+ * @brief Mimetic D * diag(K) * G + C whose values are refreshed in place
+ *
+ * The nonzero pattern of the product and, for every nonzero, the list of
+ * face coefficients that contribute to it are computed once. refresh()
+ * then recomputes the values from new face coefficients K in a single pass
+ * over the nonzeros, without merging patterns. C is a
+ * constant part such as the BC operator, or the identity for
+ * I - dt * D * diag(K) * G (pass -dt * K to refresh()).
+ *
+ * The pattern is structural, so it stays the same even when some
+ * coefficients are zero, which lets Factorization::refactorize() reuse
+ * the symbolic analysis after every refresh (EIGEN builds only, see
+ * Factorization).
+ *
+ * @note The stored zeros are intentional. Armadillo operations that build
+ * a new sp_mat from this one, e.g. A + B, A * 2 or A.t(), drop them, so
+ * pass the VariableLaplacian itself to refactorize(). Only change the
+ * values through refresh(), element access that writes to the matrix
+ * breaks the fixed pattern.
+ */
+class VariableLaplacian : public sp_mat {
+
+public:
+  /**
+   * @brief Operator D * diag(K) * G
+   *
+   * @param D a Divergence (cells by faces)
+   * @param G a Gradient (faces by cells)
+   * @param K face coefficients, one per row of G
+   */
+  VariableLaplacian(const sp_mat &D, const sp_mat &G, const vec &K);
+
+  /**
+   * @brief Operator D * diag(K) * G + C
+   *
+   * @param D a Divergence (cells by faces)
+   * @param G a Gradient (faces by cells)
+   * @param K face coefficients, one per row of G
+   * @param C a constant operator, e.g. RobinBC, MixedBC or the identity
+   */
+  VariableLaplacian(const sp_mat &D, const sp_mat &G, const vec &K,
+                    const sp_mat &C);
+
+  /**
+   * @brief Recomputes the values in place for new face coefficients
+   *
+   * @param K face coefficients, one per row of G
+   */
+  void refresh(const vec &K);
+
+private:
+  uword n_faces; ///< Number of faces, the length of K
+  uvec start; ///< Contributions of nonzero p are start(p) to start(p+1)-1
+  uvec faces; ///< Face of each contribution
+  vec coeffs; ///< D(i, f) * G(f, j) of each contribution
+  vec constant; ///< Value of C at each nonzero
+};
+
+#endif // VARIABLELAPLACIAN_H
@@ -1,29 +1,90 @@
-function [t, y] = rk4(func, tspan, dt, y0)
+function [t, y] = rk4(func, tspan, dt, y0, varargin)
 % Explicit Runge-Kutta 4th-order method
 %
 % Returns: t (evaluation points) and y (solutions) of the specified ODE
 %
 % Parameters:
-%                func : Function handler
+%                func : Function handler, or [] when 'Operator' is given
 %               tspan : [t0 tf]
 %                  dt : Step size
 %                  y0 : Initial conditions
+%            varargin : Optional name-value pairs, names are case-insensitive
+%                       'SaveEvery' : Keep every Nth step and the last one (default 1)
+%                       'FinalOnly' : If true, return only the final state (default false)
+%                        'Observer' : Function handler called as observer(t, y) at t0 and
+%                                     every SaveEvery steps, e.g. to plot or write y
+%                        'Operator' : Sparse matrix A, the RHS becomes A*y (+ func(t, y))
+%
+% Example: [t, y] = rk4([], [0 10], dt, u0, 'Operator', L, 'FinalOnly', true);
 % ----------------------------------------------------------------------------
 % SPDX-License-Identifier: GPL-3.0-or-later
 % © 2008-2024 San Diego State University Research Foundation (SDSURF).
 % See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
 % ----------------------------------------------------------------------------
 
-    t = tspan(1) : dt : tspan(2);
-    y = zeros(length(y0), length(t));
-    y(:, 1) = y0;
-    
-    for i = 1 : length(t) - 1
-        k1 = func(t(i),        y(:, i));
-        k2 = func(t(i) + dt/2, y(:, i) + dt/2*k1);
-        k3 = func(t(i) + dt/2, y(:, i) + dt/2*k2);
-        k4 = func(t(i) + dt,   y(:, i) + dt*k3);
-        
-        y(:, i + 1) = y(:, i) + dt/6*(k1 + 2*k2 + 2*k3 + k4);
+    opts = struct('SaveEvery', 1, 'FinalOnly', false, 'Observer', [], ...
+                  'Operator', []);
+    assert(mod(numel(varargin), 2) == 0, 'rk4:options', ...
+           'Options must be given as name-value pairs');
+    names = fieldnames(opts);
+    for j = 1 : 2 : numel(varargin)
+        name = validatestring(varargin{j}, names);
+        opts.(name) = varargin{j + 1};
+    end
+
+    A = opts.Operator;
+    if isempty(A)
+        rhs = func;
+    elseif isempty(func)
+        rhs = @(t, y) A*y;
+    else
+        rhs = @(t, y) A*y + func(t, y);
+    end
+
+    tt = tspan(1) : dt : tspan(2);
+    steps = length(tt) - 1;
+    every = opts.SaveEvery;
+
+    % Only the saved steps are stored
+    if opts.FinalOnly
+        saved = steps;
+    else
+        saved = unique([0 : every : steps, steps]);
+    end
+    t = tt(saved + 1);
+    y = zeros(length(y0), length(saved));
+
+    ys = y0(:);
+    s = 1;
+    if saved(1) == 0
+        y(:, 1) = ys;
+        s = 2;
+    end
+    if ~isempty(opts.Observer)
+        opts.Observer(tt(1), ys);
+    end
+
+    % k and acc are the only stage buffers, reused by every step
+    for i = 1 : steps
+        k = rhs(tt(i), ys);
+        acc = k;
+        k = rhs(tt(i) + dt/2, ys + dt/2*k);
+        acc = acc + 2*k;
+        k = rhs(tt(i) + dt/2, ys + dt/2*k);
+        acc = acc + 2*k;
+        k = rhs(tt(i) + dt, ys + dt*k);
+        acc = acc + k;
+
+        ys = ys + dt/6*acc;
+
+        if mod(i, every) == 0 || i == steps
+            if s <= length(saved) && saved(s) == i
+                y(:, s) = ys;
+                s = s + 1;
+            end
+            if ~isempty(opts.Observer)
+                opts.Observer(tt(i + 1), ys);
+            end
+        end
     end
 end
@@ -0,0 +1,169 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details. 
+*/
+
+/*
+ * @file convergence_case.cpp
+ *
+ * @brief Single case of the convergence and performance sweep
+ *
+ * Solves the Poisson problem  L u = f  on the unit line, square or cube with
+ * the manufactured solution u = exp(x + y + z) and reports the max-norm
+ * error together with the setup and solve times as one JSON line.
+ * It is driven by sweep.py, which runs many cases in parallel.
+ *
+ * Usage: convergence_case <problem> <k> <dim> <m> <bc>
+ *   problem  'poisson' (the only problem so far)
+ *   k        Order of accuracy (2, 4, 6)
+ *   dim      Spatial dimension (1, 2, 3)
+ *   m        Number of cells per direction
+ *   bc       'dirichlet' (a = 1, b = 0) or 'robin' (a = 1, b = 1)
+ */
+
+#include "mole.h"
+#include <chrono>
+#include <cstdlib>
+#include <iostream>
+#include <string>
+
+using Clock = std::chrono::steady_clock;
+
+// Staggered grid: boundary nodes plus cell centers
+static vec staggered_grid(u32 m, Real dx) {
+  vec grid(m + 2);
+  grid(0) = 0;
+  grid(1) = dx / 2.0;
+  for (u32 i = 2; i <= m; i++)
+    grid(i) = grid(i - 1) + dx;
+  grid(m + 1) = 1;
+  return grid;
+}
+
+// Robin data a*u + b*du/dn of u = exp(s) at a face, s = x + y + z there
+static Real robin_value(Real s, bool outer, Real a, Real b) {
+  return a * exp(s) + (outer ? b : -b) * exp(s);
+}
+
+int main(int argc, char *argv[]) {
+  if (argc != 6) {
+    std::cerr << "Usage: " << argv[0] << " <problem> <k> <dim> <m> <bc>"
+              << std::endl;
+    return EXIT_FAILURE;
+  }
+
+  const std::string problem = argv[1];
+  const u16 k = std::atoi(argv[2]);
+  const int dim = std::atoi(argv[3]);
+  const u32 m = std::atoi(argv[4]);
+  const std::string bc = argv[5];
+
+  if (problem != "poisson") {
+    std::cerr << "Unknown problem: " << problem << std::endl;
+    return EXIT_FAILURE;
+  }
+
+  Real a = 1.0;
+  Real b;
+  if (bc == "dirichlet")
+    b = 0.0;
+  else if (bc == "robin")
+    b = 1.0;
+  else {
+    std::cerr << "Unknown boundary condition type: " << bc << std::endl;
+    return EXIT_FAILURE;
+  }
+
+  const Real dx = 1.0 / m;
+  const vec grid = staggered_grid(m, dx);
+  const u32 N = m + 2;
+
+  auto start = Clock::now();
+
+  sp_mat A;
+  vec exact;
+  vec rhs;
+
+  // Unknowns are ordered lexicographically with x running fastest
+  if (dim == 1) {
+    Laplacian L(k, m, dx);
+    RobinBC BC(k, m, dx, a, b);
+    A = L + BC;
+
+    exact = exp(grid);
+    rhs = exact;
+    rhs(0) = robin_value(0, false, a, b);
+    rhs(N - 1) = robin_value(1, true, a, b);
+  } else if (dim == 2) {
+    Laplacian L(k, m, m, dx, dx);
+    RobinBC BC(k, m, dx, m, dx, a, b);
+    A = L + BC;
+
+    exact.set_size(N * N);
+    rhs.set_size(N * N);
+    for (u32 j = 0; j < N; j++)
+      for (u32 i = 0; i < N; i++) {
+        const u32 idx = i + N * j;
+        const Real s = grid(i) + grid(j);
+        exact(idx) = exp(s);
+        // y-faces take precedence over x-faces at the corners
+        if (j == 0 || j == N - 1)
+          rhs(idx) = robin_value(s, j == N - 1, a, b);
+        else if (i == 0 || i == N - 1)
+          rhs(idx) = robin_value(s, i == N - 1, a, b);
+        else
+          rhs(idx) = 2 * exp(s);
+      }
+  } else if (dim == 3) {
+    Laplacian L(k, m, m, m, dx, dx, dx);
+    RobinBC BC(k, m, dx, m, dx, m, dx, a, b);
+    A = L + BC;
+
+    exact.set_size(N * N * N);
+    rhs.set_size(N * N * N);
+    for (u32 l = 0; l < N; l++)
+      for (u32 j = 0; j < N; j++)
+        for (u32 i = 0; i < N; i++) {
+          const u32 idx = i + N * (j + N * l);
+          const Real s = grid(i) + grid(j) + grid(l);
+          exact(idx) = exp(s);
+          // z-faces take precedence over y-faces, y-faces over x-faces
+          if (l == 0 || l == N - 1)
+            rhs(idx) = robin_value(s, l == N - 1, a, b);
+          else if (j == 0 || j == N - 1)
+            rhs(idx) = robin_value(s, j == N - 1, a, b);
+          else if (i == 0 || i == N - 1)
+            rhs(idx) = robin_value(s, i == N - 1, a, b);
+          else
+            rhs(idx) = 3 * exp(s);
+        }
+  } else {
+    std::cerr << "Unsupported dimension: " << dim << std::endl;
+    return EXIT_FAILURE;
+  }
+
+  auto assembled = Clock::now();
+
+#ifdef EIGEN
+  vec sol = Utils::spsolve_eigen(A, rhs);
+#else
+  vec sol = spsolve(A, rhs); // Will use SuperLU
+#endif
+
+  auto solved = Clock::now();
+
+  const Real error = max(abs(sol - exact));
+  const double setup_s = std::chrono::duration<double>(assembled - start).count();
+  const double solve_s = std::chrono::duration<double>(solved - assembled).count();
+
+  std::cout.precision(16);
+  std::cout << "{\"problem\": \"" << problem << "\", \"k\": " << k
+            << ", \"dim\": " << dim << ", \"m\": " << m
+            << ", \"bc\": \"" << bc << "\", \"unknowns\": " << A.n_rows
+            << ", \"nnz\": " << A.n_nonzero << ", \"error\": " << error
+            << ", \"setup_s\": " << setup_s << ", \"solve_s\": " << solve_s
+            << "}" << std::endl;
+
+  return EXIT_SUCCESS;
+}
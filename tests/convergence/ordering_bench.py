@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Reordering benchmark for MOLE
+-----------------------------
+Runs the C++ driver `ordering_case` for every combination of ordering
+(natural, rcm, nd, morton), order of accuracy k, grid size m and
+factorization ordering (colamd, kept) on the 3-D Laplacian + Robin BC,
+and writes the bandwidth, SpMV time, and LU time and fill-in (nonzeros of
+L and U) of each case to one report (JSON and Markdown), relative to the
+natural ordering. The driver must be built with Eigen (-DEIGEN), which is
+what exposes the nonzeros of the LU factors.
+
+The cases run one after another, and one per process, so that the timings
+do not compete for memory bandwidth.
+"""
+
+import os
+import sys
+import json
+import argparse
+import itertools
+import subprocess
+from pathlib import Path
+
+ORDERINGS = ['natural', 'rcm', 'nd', 'morton']
+FACTORS = ['colamd', 'kept']
+
+def run_case(driver, ordering, k, m, factor, timeout):
+    """Run a single case with the C++ driver and return its parsed result."""
+    env = dict(os.environ, OMP_NUM_THREADS='1', OPENBLAS_NUM_THREADS='1')
+    cmd = [str(driver), ordering, str(k), str(m), factor]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True,
+                              timeout=timeout, env=env)
+    except subprocess.TimeoutExpired:
+        return {'ordering': ordering, 'k': k, 'm': m, 'factor': factor,
+                'failed': f"timed out after {timeout} s"}
+    except OSError as e:
+        return {'ordering': ordering, 'k': k, 'm': m, 'factor': factor,
+                'failed': f"could not run the driver: {e}"}
+
+    if proc.returncode != 0:
+        return {'ordering': ordering, 'k': k, 'm': m, 'factor': factor,
+                'failed': proc.stderr.strip() or f"exit code {proc.returncode}"}
+
+    lines = proc.stdout.strip().splitlines()
+    try:
+        return json.loads(lines[-1])
+    except (IndexError, ValueError):
+        return {'ordering': ordering, 'k': k, 'm': m, 'factor': factor,
+                'failed': f"no result in driver output: {proc.stdout.strip()!r}"}
+
+def add_speedups(results):
+    """Add the SpMV and factorization speedups over the natural ordering."""
+    baseline = {(r['k'], r['m'], r['factor']): r for r in results
+                if r['ordering'] == 'natural' and 'failed' not in r}
+    for r in results:
+        base = baseline.get((r['k'], r['m'], r['factor']))
+        if base is None or 'failed' in r:
+            continue
+        r['spmv_speedup'] = base['spmv_s'] / r['spmv_s'] if r['spmv_s'] > 0 else float('nan')
+        r['factor_speedup'] = base['factor_s'] / r['factor_s'] if r['factor_s'] > 0 else float('nan')
+
+def write_markdown(path, results):
+    """Write the report as a Markdown table."""
+    lines = [
+        "# MOLE reordering benchmark",
+        "",
+        "3-D Laplacian + Robin BC, m cells per direction. Speedups are relative "
+        "to the natural (lexicographic) ordering with the same factorization. "
+        "Fill is the number of nonzeros of L and U over that of the operator.",
+        "",
+        "| k | m | unknowns | factor | ordering | bandwidth | SpMV [s] | SpMV speedup "
+        "| LU [s] | LU speedup | LU nnz | fill | solve [s] | residual |",
+        "|---|---|---|---|---|---|---|---|---|---|---|---|---|---|",
+    ]
+    for r in results:
+        if 'failed' in r:
+            lines.append(f"| {r['k']} | {r['m']} | | {r['factor']} | {r['ordering']} "
+                         f"| | | | | | | | | FAIL: {r['failed']} |")
+            continue
+        lu_nnz, fill = r['factor_nnz'], f"{r['factor_nnz'] / r['nnz']:.1f}"
+        lines.append(f"| {r['k']} | {r['m']} | {r['unknowns']} | {r['factor']} | "
+                     f"{r['ordering']} | {r['bandwidth']} | {r['spmv_s']:.2e} | "
+                     f"{r.get('spmv_speedup', float('nan')):.2f} | {r['factor_s']:.3f} | "
+                     f"{r.get('factor_speedup', float('nan')):.2f} | "
+                     f"{lu_nnz} | {fill} | {r['solve_s']:.3f} | "
+                     f"{r['residual']:.1e} |")
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the MOLE reordering benchmark.")
+    parser.add_argument('--driver', default='build/tests/convergence/ordering_case',
+                        help="path to the ordering_case executable")
+    parser.add_argument('-k', type=int, nargs='+', default=[2, 4],
+                        help="orders of accuracy")
+    parser.add_argument('-m', type=int, nargs='+', default=[20, 30, 40],
+                        help="cells per direction")
+    parser.add_argument('--orderings', nargs='+', default=ORDERINGS, choices=ORDERINGS)
+    parser.add_argument('--factors', nargs='+', default=FACTORS, choices=FACTORS)
+    parser.add_argument('--output', default='ordering_report',
+                        help="report path without extension (.json and .md are written)")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="timeout in seconds for a single case")
+    args = parser.parse_args()
+
+    driver = Path(args.driver).resolve()
+    if not driver.exists():
+        print(f"Error: driver not found at {driver}. Build it with 'cmake --build build'.")
+        return 1
+
+    results = []
+    for k, m, factor, ordering in itertools.product(args.k, sorted(args.m),
+                                                    args.factors, args.orderings):
+        result = run_case(driver, ordering, k, m, factor, args.timeout)
+        results.append(result)
+        status = result.get('failed', f"LU {result.get('factor_s', 0):.3f} s")
+        print(f"  k={k} m={m} factor={factor} ordering={ordering}: {status}")
+    add_speedups(results)
+
+    with open(f"{args.output}.json", 'w') as f:
+        json.dump({'cases': results}, f, indent=2)
+    write_markdown(f"{args.output}.md", results)
+
+    failed = [r for r in results if 'failed' in r]
+    print(f"Report written to {args.output}.json and {args.output}.md")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+/*
+* SPDX-License-Identifier: GPL-3.0-or-later
+* © 2008-2024 San Diego State University Research Foundation (SDSURF).
+* See LICENSE file or https://www.gnu.org/licenses/gpl-3.0.html for details.
+*/
+
+/*
+ * @file ordering_case.cpp
+ *
+ * @brief Single case of the reordering benchmark
+ *
+ * Assembles the 3-D Laplacian + Robin BC on an m x m x m grid, renumbers
+ * its unknowns and reports the bandwidth, the SpMV time, and the time and
+ * fill-in (nonzeros of L and U) of the LU factorization as one JSON line.
+ * It is driven by ordering_bench.py, which runs one case per process.
+ *
+ * Requires the Eigen build (-DEIGEN): SuperLU's factors are not exposed,
+ * so the fill-in cannot be measured without it and the driver exits with
+ * an error.
+ *
+ * Usage: ordering_case <ordering> <k> <m> <factor>
+ *   ordering  'natural', 'rcm', 'nd' (nested dissection) or 'morton'
+ *   k         Order of accuracy (2, 4, 6)
+ *   m         Number of cells per direction
+ *   factor    'colamd' (the solver's default column ordering) or 'kept'
+ *             (factorize in the given ordering)
+ */
+
+#include "mole.h"
+#include <chrono>
+#include <cstdlib>
+#include <iostream>
+#include <string>
+
+#ifndef EIGEN
+int main() {
+  std::cerr << "ordering_case needs the Eigen build (-DEIGEN) to measure "
+               "the fill-in of the LU factors"
+            << std::endl;
+  return EXIT_FAILURE;
+}
+#else
+using Clock = std::chrono::steady_clock;
+
+static double seconds(Clock::time_point from, Clock::time_point to) {
+  return std::chrono::duration<double>(to - from).count();
+}
+
+int main(int argc, char *argv[]) {
+  if (argc != 5) {
+    std::cerr << "Usage: " << argv[0] << " <ordering> <k> <m> <factor>"
+              << std::endl;
+    return EXIT_FAILURE;
+  }
+
+  const std::string ordering = argv[1];
+  const u16 k = std::atoi(argv[2]);
+  const u32 m = std::atoi(argv[3]);
+  const std::string factor = argv[4];
+
+  if (factor != "colamd" && factor != "kept") {
+    std::cerr << "Unknown factorization ordering: " << factor << std::endl;
+    return EXIT_FAILURE;
+  }
+
+  const Real dx = 1.0 / m;
+  const u32 N = m + 2;
+
+  Laplacian L(k, m, m, m, dx, dx, dx);
+  RobinBC BC(k, m, dx, m, dx, m, dx, 1, 1);
+  const sp_mat A = L + BC;
+
+  auto start = Clock::now();
+
+  uvec natural = regspace<uvec>(0, A.n_rows - 1);
+  Ordering P(natural);
+  if (ordering == "rcm")
+    P = Ordering::rcm(A);
+  else if (ordering == "nd")
+    P = Ordering::nested_dissection(N, N, N, k - 1);
+  else if (ordering == "morton")
+    P = Ordering::morton(N, N, N);
+  else if (ordering != "natural") {
+    std::cerr << "Unknown ordering: " << ordering << std::endl;
+    return EXIT_FAILURE;
+  }
+  const sp_mat PA = P.permute_operator(A);
+
+  auto reordered = Clock::now();
+
+  const vec rhs = ones(A.n_rows);
+  const vec x = P.permute_field(rhs);
+  vec y;
+  const int spmv_repeats = 20;
+  auto spmv_start = Clock::now();
+  for (int i = 0; i < spmv_repeats; ++i)
+    y = PA * x;
+  auto spmv_end = Clock::now();
+
+  auto factor_start = Clock::now();
+  Factorization lu(PA, factor == "kept");
+  auto factored = Clock::now();
+
+  const vec sol = P.restore_field(lu.solve(P.permute_field(rhs)));
+  auto solved = Clock::now();
+
+  const Real residual = norm(A * sol - rhs) / norm(rhs);
+
+  std::cout.precision(16);
+  std::cout << "{\"ordering\": \"" << ordering << "\", \"k\": " << k
+            << ", \"m\": " << m << ", \"factor\": \"" << factor
+            << "\", \"unknowns\": " << A.n_rows << ", \"nnz\": " << A.n_nonzero
+            << ", \"bandwidth\": " << Ordering::bandwidth(PA)
+            << ", \"reorder_s\": " << seconds(start, reordered)
+            << ", \"spmv_s\": " << seconds(spmv_start, spmv_end) / spmv_repeats
+            << ", \"factor_s\": " << seconds(factor_start, factored)
+            << ", \"factor_nnz\": " << lu.factor_nnz()
+            << ", \"solve_s\": " << seconds(factored, solved)
+            << ", \"residual\": " << residual << "}" << std::endl;
+
+  return EXIT_SUCCESS;
+}
+#endif
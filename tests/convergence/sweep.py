@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Convergence and performance sweep for MOLE
+------------------------------------------
+Runs a declarative matrix of (problem, k, dimension, grid sizes, BC type)
+cases through the C++ driver `convergence_case`, spreading the individual
+solves over a process pool. For each case the observed order of accuracy
+between successive grid sizes and the time-to-solution are computed, and
+everything is written to one consolidated report (JSON and Markdown).
+
+Matrix format (JSON), any of problem/k/dim/bc may be a scalar or a list:
+
+    {"cases": [
+        {"problem": "poisson", "k": [2, 4], "dim": 2,
+         "grid_sizes": [20, 40, 80], "bc": ["robin", "dirichlet"]}
+    ]}
+
+A case passes when every observed order is at least `min_order`
+(default: k - 0.5, the same threshold used by tests/cpp/test5.cpp).
+Orders whose finer grid has an error below `error_floor` (default: 1e-9)
+are reported but not judged, since roundoff in the solve dominates there.
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import argparse
+import itertools
+import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+# Errors below this are dominated by roundoff, not by the discretization
+ERROR_FLOOR = 1e-9
+
+def as_list(value):
+    """Return value as a list, wrapping scalars."""
+    return value if isinstance(value, list) else [value]
+
+def expand_matrix(matrix):
+    """Expand the declarative matrix into a list of cases."""
+    cases = []
+    for entry in matrix['cases']:
+        for problem, k, dim, bc in itertools.product(
+                as_list(entry.get('problem', 'poisson')), as_list(entry['k']),
+                as_list(entry['dim']), as_list(entry.get('bc', 'robin'))):
+            cases.append({
+                'problem': problem,
+                'k': k,
+                'dim': dim,
+                'bc': bc,
+                'grid_sizes': sorted(entry['grid_sizes']),
+                'min_order': entry.get('min_order', k - 0.5),
+                'error_floor': entry.get('error_floor', ERROR_FLOOR),
+            })
+    return cases
+
+def run_case(driver, problem, k, dim, m, bc, timeout):
+    """Run a single solve with the C++ driver and return its parsed result."""
+    # Each process solves one problem, so keep it from oversubscribing cores
+    env = dict(os.environ, OMP_NUM_THREADS='1', OPENBLAS_NUM_THREADS='1')
+    cmd = [str(driver), problem, str(k), str(dim), str(m), bc]
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True,
+                              timeout=timeout, env=env)
+    except subprocess.TimeoutExpired:
+        return {'problem': problem, 'k': k, 'dim': dim, 'm': m, 'bc': bc,
+                'failed': f"timed out after {timeout} s"}
+    except OSError as e:
+        return {'problem': problem, 'k': k, 'dim': dim, 'm': m, 'bc': bc,
+                'failed': f"could not run the driver: {e}"}
+    wall_s = time.perf_counter() - start
+
+    if proc.returncode != 0:
+        return {'problem': problem, 'k': k, 'dim': dim, 'm': m, 'bc': bc,
+                'failed': proc.stderr.strip() or f"exit code {proc.returncode}"}
+
+    lines = proc.stdout.strip().splitlines()
+    try:
+        result = json.loads(lines[-1])
+    except (IndexError, ValueError):
+        return {'problem': problem, 'k': k, 'dim': dim, 'm': m, 'bc': bc,
+                'failed': f"no result in driver output: {proc.stdout.strip()!r}"}
+    result['wall_s'] = wall_s
+    return result
+
+def observed_orders(grid_sizes, errors):
+    """Observed orders of accuracy between successive grid sizes."""
+    orders = []
+    for (m1, e1), (m2, e2) in zip(zip(grid_sizes, errors),
+                                  zip(grid_sizes[1:], errors[1:])):
+        if e1 > 0 and e2 > 0:
+            orders.append(math.log(e1 / e2) / math.log(m2 / m1))
+        else:
+            orders.append(float('nan'))
+    return orders
+
+def summarize(case, results):
+    """Combine the runs of one case into its report entry."""
+    runs = [results[(case['problem'], case['k'], case['dim'], m, case['bc'])]
+            for m in case['grid_sizes']]
+    summary = dict(case, runs=runs)
+
+    failures = [run for run in runs if 'failed' in run]
+    if failures:
+        summary['passed'] = False
+        summary['error'] = '; '.join(f"m={run['m']}: {run['failed']}" for run in failures)
+        return summary
+
+    errors = [run['error'] for run in runs]
+    summary['orders'] = observed_orders(case['grid_sizes'], errors)
+    summary['judged'] = [e >= case['error_floor'] for e in errors[1:]]
+    summary['time_to_solution_s'] = [run['setup_s'] + run['solve_s'] for run in runs]
+    summary['passed'] = all(order >= case['min_order']
+                            for order, judged in zip(summary['orders'], summary['judged'])
+                            if judged)
+    return summary
+
+def write_markdown(path, summaries, elapsed):
+    """Write the consolidated report as a Markdown table."""
+    lines = [
+        "# MOLE convergence and performance sweep",
+        "",
+        f"{len(summaries)} cases, {sum(s['passed'] for s in summaries)} passed, "
+        f"wall time {elapsed:.1f} s",
+        "",
+        "Orders in parentheses are below the error floor and not judged.",
+        "",
+        "| problem | k | dim | bc | m | unknowns | error | order | setup [s] | solve [s] | status |",
+        "|---|---|---|---|---|---|---|---|---|---|---|",
+    ]
+    for s in summaries:
+        status = "PASS" if s['passed'] else "FAIL"
+        for i, run in enumerate(s['runs']):
+            if 'failed' in run:
+                lines.append(f"| {s['problem']} | {s['k']} | {s['dim']} | {s['bc']} | "
+                             f"{run['m']} | | | | | | {status}: {run['failed']} |")
+                continue
+            order = ""
+            if i > 0 and 'orders' in s:
+                order = f"{s['orders'][i - 1]:.2f}"
+                if not s['judged'][i - 1]:
+                    order = f"({order})"
+            lines.append(f"| {s['problem']} | {s['k']} | {s['dim']} | {s['bc']} | "
+                         f"{run['m']} | {run['unknowns']} | {run['error']:.3e} | "
+                         f"{order} | {run['setup_s']:.3f} | {run['solve_s']:.3f} | "
+                         f"{status} |")
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the MOLE convergence and performance sweep.")
+    parser.add_argument('--driver', default='build/tests/convergence/convergence_case',
+                        help="path to the convergence_case executable")
+    parser.add_argument('--matrix', default=str(SCRIPT_DIR / 'sweep_matrix.json'),
+                        help="JSON file with the case matrix")
+    parser.add_argument('--output', default='sweep_report',
+                        help="report path without extension (.json and .md are written)")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="number of parallel solves (default: all cores)")
+    parser.add_argument('--timeout', type=float, default=None,
+                        help="timeout in seconds for a single solve")
+    args = parser.parse_args()
+
+    driver = Path(args.driver).resolve()
+    if not driver.exists():
+        print(f"Error: driver not found at {driver}. Build it with 'cmake --build build'.")
+        return 1
+
+    with open(args.matrix) as f:
+        cases = expand_matrix(json.load(f))
+
+    runs = {(c['problem'], c['k'], c['dim'], m, c['bc'])
+            for c in cases for m in c['grid_sizes']}
+    # Start the largest problems first so they do not end up as stragglers
+    runs = sorted(runs, key=lambda r: r[3] ** r[2], reverse=True)
+    print(f"Running {len(runs)} solves for {len(cases)} cases")
+
+    start = time.perf_counter()
+    results = {}
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = {pool.submit(run_case, driver, *run, args.timeout): run for run in runs}
+        for future in as_completed(futures):
+            run = futures[future]
+            results[run] = future.result()
+            problem, k, dim, m, bc = run
+            status = results[run].get('failed', f"error {results[run].get('error', 0):.3e}")
+            print(f"  {problem} k={k} dim={dim} m={m} bc={bc}: {status}")
+    elapsed = time.perf_counter() - start
+
+    summaries = [summarize(case, results) for case in cases]
+
+    with open(f"{args.output}.json", 'w') as f:
+        json.dump({'elapsed_s': elapsed, 'cases': summaries}, f, indent=2)
+    write_markdown(f"{args.output}.md", summaries, elapsed)
+
+    failed = [s for s in summaries if not s['passed']]
+    print(f"\n{len(summaries) - len(failed)}/{len(summaries)} cases passed in {elapsed:.1f} s")
+    for s in failed:
+        print(f"FAIL: {s['problem']} k={s['k']} dim={s['dim']} bc={s['bc']} "
+              f"orders={s.get('orders')} {s.get('error', '')}")
+    print(f"Report written to {args.output}.json and {args.output}.md")
+    return 1 if failed else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+#include "mole.h"
+#include <gtest/gtest.h>
+
+// -u'' + u^3 = f with Dirichlet BC, f built from a known discrete solution
+void run_newton_krylov_test(int k, Real tol) {
+    int m = 50;
+    Real dx = 1.0 / m;
+
+    Laplacian L(k, m, dx);
+    RobinBC BC(k, m, dx, 1, 0);
+    sp_mat A = (sp_mat)BC - (sp_mat)L;
+
+    vec grid(m + 2);
+    grid(0) = 0;
+    grid.subvec(1, m) = linspace(dx / 2, 1 - dx / 2, m);
+    grid(m + 1) = 1;
+
+    // The nonlinear term only acts on the interior
+    vec c(m + 2, fill::ones);
+    c(0) = c(m + 1) = 0;
+
+    vec exact = 1 + sin(M_PI * grid);
+    vec f = A * exact + c % pow(exact, 3);
+
+    NewtonKrylov solver([&](const vec &u) -> vec {
+        return A * u + c % pow(u, 3) - f;
+    }, A);
+    solver.rtol = 1e-10;
+
+    vec u(m + 2, fill::zeros);
+    ASSERT_TRUE(solver.solve(u)) << "Newton-Krylov did not converge for k = " << k;
+    ASSERT_LT(solver.iterations, 10u);
+    ASSERT_LT(norm(u - exact, "inf"), tol) << "Newton-Krylov failed for k = " << k;
+}
+
+TEST(NewtonKrylovTests, NonlinearPoisson) {
+    Real tol = 1e-8;
+    for (int k : {2, 4, 6}) {
+        run_newton_krylov_test(k, tol);
+    }
+}
+
+// F(x) = x^2 + 1 has no root and ||F|| is stationary at x = 0
+TEST(NewtonKrylovTests, LineSearchFailure) {
+    NewtonKrylov solver([](const vec &x) -> vec { return x % x + 1; });
+
+    std::vector<Real> steps;
+    solver.set_monitor([&](u32, Real, u32, Real step) { steps.push_back(step); });
+
+    vec x(1, fill::zeros);
+    ASSERT_FALSE(solver.solve(x));
+    ASSERT_TRUE(solver.status == NewtonKrylov::Status::LineSearchFailure);
+    ASSERT_EQ(solver.iterations, 1u);
+    ASSERT_EQ(solver.residual_norms.size(), 2u);
+    ASSERT_EQ(solver.residual_norms.back(), 1.0);
+    ASSERT_EQ(steps.size(), 2u);
+    ASSERT_EQ(steps.back(), 0.0);
+    ASSERT_EQ(x(0), 0.0);
+}
+
+// A constant F has J = 0, GMRES breaks down and must not produce NaN
+TEST(NewtonKrylovTests, Breakdown) {
+    NewtonKrylov solver([](const vec &x) -> vec { return ones<vec>(x.n_elem); });
+
+    vec x(4, fill::zeros);
+    ASSERT_FALSE(solver.solve(x));
+    ASSERT_TRUE(solver.status == NewtonKrylov::Status::LineSearchFailure);
+    ASSERT_TRUE(x.is_finite());
+    ASSERT_TRUE(std::isfinite(solver.residual_norms.back()));
+}
@@ -0,0 +1,50 @@
+#include "mole.h"
+#include <gtest/gtest.h>
+
+void run_variable_laplacian_test(int k, Real tol) {
+    int m = 2 * k + 1;
+    int n = m + 2;
+    Real dx = 1.0 / m, dy = 1.0 / n;
+
+    Divergence D(k, m, n, dx, dy);
+    Gradient G(k, m, n, dx, dy);
+    RobinBC BC(k, m, dx, n, dy, 1, 1);
+
+    vec K = 1 + randu<vec>(G.n_rows);
+    VariableLaplacian A(D, G, K, BC);
+    uword nnz = A.n_nonzero;
+
+    sp_mat expected = (sp_mat)D * sp_mat(diagmat(K)) * (sp_mat)G + (sp_mat)BC;
+    ASSERT_LT(norm((sp_mat)A - expected, "inf"), tol) << "Assembly failed for k = " << k;
+
+    // A zero coefficient must not change the pattern
+    K = 1 + randu<vec>(G.n_rows);
+    K(0) = 0;
+    A.refresh(K);
+    expected = (sp_mat)D * sp_mat(diagmat(K)) * (sp_mat)G + (sp_mat)BC;
+    ASSERT_EQ(A.n_nonzero, nnz);
+    ASSERT_LT(norm((sp_mat)A - expected, "inf"), tol) << "Refresh failed for k = " << k;
+
+    // A pending element write is overwritten by the next refresh
+    A(0, 0) = 1e6;
+    A.refresh(K);
+    ASSERT_EQ(A.n_nonzero, nnz);
+    ASSERT_LT(std::abs(A(0, 0) - expected(0, 0)), tol) << "Stale cache for k = " << k;
+
+    // Numeric refactorization after a refresh
+    vec b = randu<vec>(A.n_rows);
+    Factorization lu(A);
+    K = 1 + randu<vec>(G.n_rows);
+    A.refresh(K);
+    lu.refactorize(A);
+    vec x = lu.solve(b);
+    vec r = (sp_mat)A * x - b;
+    ASSERT_LT(norm(r), tol) << "Refactorization failed for k = " << k;
+}
+
+TEST(VariableLaplacianTests, Refresh) {
+    Real tol = 1e-8;
+    for (int k : {2, 4, 6}) {
+        run_variable_laplacian_test(k, tol);
+    }
+}
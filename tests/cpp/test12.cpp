@@ -0,0 +1,69 @@
+#include "mole.h"
+#include <gtest/gtest.h>
+
+// Solving in a reordered numbering must give the same solution
+void run_ordering_test(const Ordering &P, const sp_mat &A, const vec &b,
+                       const vec &expected, Real tol, const std::string &name) {
+    vec u = randu<vec>(A.n_rows);
+    ASSERT_TRUE(all(P.restore_field(P.permute_field(u)) == u)) << name;
+
+    // P A P' (P u) = P (A u)
+    vec Au = A * u;
+    vec PAPu = P.permute_operator(A) * P.permute_field(u);
+    ASSERT_LT(norm(P.restore_field(PAPu) - Au, "inf"), tol) << name;
+
+    Factorization lu(P.permute_operator(A), true);
+    vec x = P.restore_field(lu.solve(P.permute_field(b)));
+    ASSERT_LT(norm(x - expected, "inf"), tol) << name;
+}
+
+TEST(OrderingTests, Reordering) {
+    Real tol = 1e-8;
+    for (int k : {2, 4}) {
+        int m = 2 * k + 3;
+        u32 N = m + 2;
+        Real dx = 1.0 / m;
+
+        Laplacian L(k, m, m, m, dx, dx, dx);
+        RobinBC BC(k, m, dx, m, dx, m, dx, 1, 1);
+        sp_mat A = L + BC;
+        vec b = randu<vec>(A.n_rows);
+        vec expected = Factorization(A).solve(b);
+
+        // RCM recovers a small bandwidth from a scrambled numbering
+        Ordering scrambled(shuffle(regspace<uvec>(0, A.n_rows - 1)));
+        sp_mat S = scrambled.permute_operator(A);
+        ASSERT_LT(Ordering::bandwidth(Ordering::rcm(S).permute_operator(S)),
+                  Ordering::bandwidth(S) / 2) << "RCM failed for k = " << k;
+
+        Ordering rcm = Ordering::rcm(A);
+
+        run_ordering_test(rcm, A, b, expected, tol, "RCM");
+        run_ordering_test(Ordering::nested_dissection(N, N, N, k - 1), A, b,
+                          expected, tol, "Nested dissection");
+        run_ordering_test(Ordering::morton(N, N, N), A, b, expected, tol,
+                          "Morton");
+    }
+}
+
+// Orderings of an empty operator must not wrap around
+TEST(OrderingTests, Empty) {
+    Ordering P(uvec{});
+    ASSERT_EQ(P.perm().n_elem, 0u);
+    ASSERT_EQ(P.inverse().n_elem, 0u);
+    ASSERT_EQ(Ordering::rcm(sp_mat()).perm().n_elem, 0u);
+    ASSERT_EQ(Ordering::morton(0, 0, 0).perm().n_elem, 0u);
+}
+
+// Rectangular operators take one ordering for rows and one for columns
+TEST(OrderingTests, Rectangular) {
+    int k = 2, m = 7, n = 9;
+    Gradient G(k, m, n, 1.0 / m, 1.0 / n);
+    Ordering rows = Ordering::rcm(sp_mat((sp_mat)G * ((sp_mat)G).t()));
+    Ordering cols = Ordering::morton(m + 2, n + 2);
+
+    vec u = randu<vec>(G.n_cols);
+    vec Gu = (sp_mat)G * u;
+    vec PGu = rows.permute_operator(G, cols) * cols.permute_field(u);
+    ASSERT_LT(norm(rows.restore_field(PGu) - Gu, "inf"), 1e-12);
+}
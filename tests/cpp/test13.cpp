@@ -0,0 +1,85 @@
+#include "mole.h"
+#include <gtest/gtest.h>
+
+// Periodic operators are circulant, D = -G' and L annihilates constants
+void run_periodic_operator_test(int k, Real tol) {
+    int m = 4 * k;
+    Real dx = 1.0 / m;
+
+    Gradient G(k, m, dx, Periodic{true});
+    Divergence D(k, m, dx, Periodic{true});
+    Laplacian L(k, m, dx, Periodic{true});
+
+    ASSERT_EQ(G.n_rows, (uword)m);
+    ASSERT_LT(norm((sp_mat)D + ((sp_mat)G).t(), "inf"), tol);
+    ASSERT_LT(norm((sp_mat)L * ones<vec>(m), "inf"), tol);
+
+    // L sin(2 pi x) = -4 pi^2 sin(2 pi x) at the cell centers
+    vec xc = linspace(dx / 2, 1 - dx / 2, m);
+    vec err = (sp_mat)L * sin(2 * M_PI * xc) + 4 * M_PI * M_PI * sin(2 * M_PI * xc);
+    ASSERT_LT(norm(err, "inf"), 4 * M_PI * M_PI * 0.1) << "Periodic Laplacian failed for k = " << k;
+
+    // Non-periodic directions keep their boundary points
+    Laplacian L2(k, m, m + 1, dx, dx, Periodic{true, false});
+    ASSERT_EQ(L2.n_rows, (uword)m * (m + 3));
+}
+
+// The FFT solves must match a sparse LU of the same operator
+void run_fft_solver_test(const FFTSolver &solver, Real tol, bool singular,
+                         const std::string &name) {
+    sp_mat A = solver.matrix();
+    vec u = randu<vec>(A.n_rows);
+    if (singular)
+        u -= mean(u);
+    vec f = A * u;
+
+    vec x = solver.solve(f);
+    ASSERT_LT(norm(A * x - f, "inf") / norm(f, "inf"), tol) << name;
+    if (!singular)
+        ASSERT_LT(norm(x - u, "inf"), tol) << name;
+}
+
+TEST(PeriodicTests, Operators) {
+    Real tol = 1e-10;
+    for (int k : {2, 4, 6}) {
+        run_periodic_operator_test(k, tol);
+    }
+}
+
+// Calls with integer spacings still pick the non-periodic constructors
+TEST(PeriodicTests, IntegerArguments) {
+    Gradient G(2, 5, 5, 5, 1, 1, 1);
+    Divergence D(2, 5, 5, 5, 1, 1, 1);
+    Laplacian L(2, 5, 5, 5, 1, 1, 1);
+    Laplacian L2(2, 5, 5, 1, 1);
+
+    ASSERT_EQ(G.n_rows, 450u);
+    ASSERT_EQ(G.n_cols, 343u);
+    ASSERT_EQ(D.n_rows, 343u);
+    ASSERT_EQ(D.n_cols, 450u);
+    ASSERT_EQ(L.n_rows, 343u);
+    ASSERT_EQ(L2.n_rows, 49u);
+}
+
+TEST(PeriodicTests, FFTSolver) {
+    Real tol = 1e-8;
+    for (int k : {2, 4}) {
+        int m = 2 * k + 4, n = m + 1, o = m + 2;
+        Real dx = 1.0 / m, dy = 1.0 / n, dz = 1.0 / o;
+
+        run_fft_solver_test(FFTSolver(k, m, dx), tol, true, "1-D periodic");
+        run_fft_solver_test(FFTSolver(k, m, n, dx, dy, Periodic{true, true}),
+                            tol, true, "2-D periodic");
+        run_fft_solver_test(FFTSolver(k, m, n, dx, dy, Periodic{true, false}),
+                            tol, false, "2-D periodic in x, Dirichlet in y");
+        run_fft_solver_test(FFTSolver(k, m, n, o, dx, dy, dz,
+                                      Periodic{true, false, true}, 1, 1),
+                            tol, false, "3-D channel, Robin in y");
+        run_fft_solver_test(FFTSolver(k, m, n, o, dx, dy, dz,
+                                      Periodic{false, true, false}, 1, 0),
+                            tol, false, "3-D periodic in y, Dirichlet in x, z");
+        run_fft_solver_test(FFTSolver(k, m, n, o, dx, dy, dz,
+                                      Periodic{true, false, true}, 0, 1),
+                            tol, true, "3-D channel, Neumann in y");
+    }
+}
@@ -0,0 +1,49 @@
+#include "mole.h"
+#include <gtest/gtest.h>
+#include <type_traits>
+
+void run_composition_test(int k, Real tol) {
+    int m = 2 * k + 1;
+    Real dx = 1.0 / m;
+
+    Divergence D(k, m, m, dx, dx);
+    Gradient G(k, m, m, dx, dx);
+    Laplacian L(k, m, m, dx, dx);
+    RobinBC BC(k, m, dx, m, dx, 1, 1);
+
+    vec u = randu<vec>(L.n_cols);
+
+    // Compositions of the operators themselves are assembled
+    static_assert(std::is_same<decltype(D * G), sp_mat>::value, "D * G");
+    static_assert(std::is_same<decltype(L + BC), sp_mat>::value, "L + BC");
+    ASSERT_EQ(sp_mat((L + BC).t()).n_rows, L.n_cols);
+
+    // Unevaluated div * grad matches the assembled Laplacian
+    OperatorExpression DG = OperatorExpression(D) * G;
+    ASSERT_LT(norm(DG * u - L * u), tol) << "Apply failed for k = " << k;
+
+    // Temporaries are moved into the expression, which then owns them
+    OperatorExpression T = OperatorExpression(sp_mat(D)) * sp_mat(G);
+    ASSERT_LT(norm(T * u - L * u), tol) << "Owned factors failed for k = " << k;
+
+    sp_mat A = DG;
+    ASSERT_LT(norm(vec(A * u) - L * u), tol) << "Assembly failed for k = " << k;
+
+    // Scaled sums, lap + bc and variable coefficients
+    vec K = 1 + randu<vec>(G.n_rows);
+    OperatorExpression E = 0.5 * (OperatorExpression(L) + BC) - OperatorExpression(D) * OperatorExpression(K) * G;
+
+    sp_mat K_diag(K.n_elem, K.n_elem);
+    K_diag.diag() = K;
+    sp_mat expected = 0.5 * ((sp_mat)L + (sp_mat)BC) - (sp_mat)D * K_diag * (sp_mat)G;
+
+    ASSERT_LT(norm(E * u - vec(expected * u)), tol) << "Apply failed for k = " << k;
+    ASSERT_LT(norm(vec((E.eval() - expected) * u)), tol) << "Assembly failed for k = " << k;
+}
+
+TEST(ExpressionTests, Composition) {
+    Real tol = 1e-8;
+    for (int k : {2, 4, 6}) {
+        run_composition_test(k, tol);
+    }
+}
@@ -0,0 +1,67 @@
+#include "mole.h"
+#include <gtest/gtest.h>
+#include <algorithm>
+
+// Hamiltonian of the harmonic oscillator, as in test4.cpp
+sp_mat hamiltonian(int k, int m) {
+    vec grid = linspace(-5, 5, m);
+    Real dx = grid(1) - grid(0);
+
+    Laplacian L(k, m - 2, dx);
+
+    std::transform(grid.begin(), grid.end(), grid.begin(),
+                   [](Real x) { return x * x; });
+
+    sp_mat V(m, m);
+    V.diag(0) = grid;
+
+    return -0.5 * (sp_mat)L + V;
+}
+
+TEST(EigensolverTests, ShiftInvert) {
+    Real tol = 1e-10;
+    sp_mat H = hamiltonian(4, 500);
+
+    Eigensolver solver(H);
+    cx_vec eigval;
+    cx_mat eigvec;
+
+    ASSERT_TRUE(solver.eigs(eigval, eigvec, 5, "sm"));
+
+    vec expected{1, 3, 5, 7, 9};
+    for (int i = 0; i < expected.size(); ++i) {
+        ASSERT_LT(std::norm(real(eigval(i) / eigval(0)) - expected(i)), tol)
+            << "Smallest eigenvalue test failed for index " << i;
+        vec x = real(eigvec.col(i));
+        vec r = H * x - real(eigval(i)) * x;
+        ASSERT_LT(norm(r), 1e-6) << "Residual test failed for index " << i;
+    }
+
+    // Eigenvalue nearest to a shift. E0 = 1 / sqrt(2) for H = -L / 2 + x^2,
+    // so 6.3 is nearest to 9 * E0 = 6.36
+    cx_vec nearest;
+    ASSERT_TRUE(solver.eigs(nearest, eigvec, 1, 6.3));
+    ASSERT_LT(std::norm(real(nearest(0) / eigval(0)) - 9), tol);
+}
+
+TEST(EigensolverTests, MassInnerProduct) {
+    Real tol = 1e-8;
+    int m = 100;
+    sp_mat H = hamiltonian(2, m);
+    vec w = 1 + randu<vec>(m);
+
+    Eigensolver solver(H, w);
+    cx_vec eigval;
+    cx_mat eigvec;
+
+    ASSERT_TRUE(solver.eigs(eigval, eigvec, 3, "sm"));
+
+    cx_vec expected;
+    eig_gen(expected, mat(diagmat(1 / w)) * mat(H));
+    expected = expected.elem(sort_index(abs(expected)));
+
+    for (int i = 0; i < 3; ++i) {
+        ASSERT_LT(std::abs(eigval(i) - expected(i)), tol * std::abs(expected(i)))
+            << "Generalized eigenvalue test failed for index " << i;
+    }
+}
@@ -0,0 +1,49 @@
+#include "mole.h"
+#include <gtest/gtest.h>
+
+// Operators built concurrently must match the ones built in sequence
+void run_construction_test(int k) {
+    int m = 2 * k + 1;
+    int n = m + 1;
+    int o = m + 2;
+    Real dx = 1.0 / m, dy = 1.0 / n, dz = 1.0 / o;
+    std::vector<Real> dirichlet{1}, robin{1, 1};
+
+    Utils::set_construction_threads(1);
+    sp_mat L1 = Laplacian(k, m, n, o, dx, dy, dz);
+    sp_mat I1 = Interpol(m, n, o, 0.5, 0.5, 0.5);
+    sp_mat R1 = RobinBC(k, m, dx, n, dy, o, dz, 1, 1);
+    sp_mat B1 = MixedBC(k, m, dx, n, dy, o, dz, "Dirichlet", dirichlet,
+                        "Robin", robin, "Dirichlet", dirichlet, "Neumann",
+                        dirichlet, "Robin", robin, "Dirichlet", dirichlet);
+
+    Utils::set_construction_threads(4);
+    sp_mat L4 = Laplacian(k, m, n, o, dx, dy, dz);
+    sp_mat I4 = Interpol(m, n, o, 0.5, 0.5, 0.5);
+    sp_mat R4 = RobinBC(k, m, dx, n, dy, o, dz, 1, 1);
+    sp_mat B4 = MixedBC(k, m, dx, n, dy, o, dz, "Dirichlet", dirichlet,
+                        "Robin", robin, "Dirichlet", dirichlet, "Neumann",
+                        dirichlet, "Robin", robin, "Dirichlet", dirichlet);
+
+    Utils::set_construction_threads(0);
+
+    ASSERT_EQ(norm(L1 - L4, "fro"), 0.0) << "Laplacian failed for k = " << k;
+    ASSERT_EQ(norm(I1 - I4, "fro"), 0.0) << "Interpol failed for k = " << k;
+    ASSERT_EQ(norm(R1 - R4, "fro"), 0.0) << "RobinBC failed for k = " << k;
+    ASSERT_EQ(norm(B1 - B4, "fro"), 0.0) << "MixedBC failed for k = " << k;
+}
+
+TEST(ConstructionTests, Concurrent) {
+    for (int k : {2, 4, 6}) {
+        run_construction_test(k);
+    }
+}
+
+TEST(ConstructionTests, ErrorInTask) {
+    std::vector<Real> coeffs{1};
+    ASSERT_THROW(MixedBC(2, 5, 0.2, 5, 0.2, 5, 0.2, "Dirichlet", coeffs,
+                         "Dirichlet", coeffs, "Dirichlet", coeffs,
+                         "Dirichlet", coeffs, "Unknown", coeffs, "Dirichlet",
+                         coeffs),
+                 std::invalid_argument);
+}
@@ -0,0 +1,55 @@
+classdef testRK4 < matlab.unittest.TestCase
+    methods(Test)
+        function testforRK4Output(testCase)
+            addpath ('../../src/matlab')
+
+            % Heat equation, u_t = L*u
+            k = 2;
+            m = 20;
+            dx = 1/m;
+            L = lap(k, m, dx);
+            u0 = sin(pi*[0 dx/2 : dx : 1-dx/2 1]');
+            dt = dx^2/4;
+            tspan = [0 0.05];
+            tol = 1e-12;
+
+            [t, y] = rk4(@(t, u) L*u, tspan, dt, u0);
+
+            % Every 10th step plus the last one
+            [t10, y10] = rk4(@(t, u) L*u, tspan, dt, u0, 'SaveEvery', 10);
+            idx = unique([1 : 10 : length(t), length(t)]);
+            testCase.verifyEqual(t10, t(idx));
+            testCase.verifyLessThan(max(max(abs(y10 - y(:, idx)))), tol, ...
+                "SaveEvery test failed");
+
+            % Precomputed operator and final state only
+            [tf, yf] = rk4([], tspan, dt, u0, 'Operator', L, 'FinalOnly', true);
+            testCase.verifyEqual(tf, t(end));
+            testCase.verifyLessThan(max(abs(yf - y(:, end))), tol, ...
+                "Operator test failed");
+
+            % The observer streams the same states
+            store = containers.Map('KeyType', 'double', 'ValueType', 'any');
+            rk4([], tspan, dt, u0, 'Operator', L, 'FinalOnly', true, ...
+                'SaveEvery', 10, 'Observer', @(t, u) observe(store, u));
+            streamed = cell2mat(values(store));
+            testCase.verifyLessThan(max(max(abs(streamed - y10))), tol, ...
+                "Observer test failed");
+
+            % Option names are case-insensitive
+            [tc, yc] = rk4(@(t, u) L*u, tspan, dt, u0, 'saveevery', 10);
+            testCase.verifyEqual(tc, t10);
+            testCase.verifyEqual(yc, y10);
+
+            % Unknown options and unpaired names are rejected
+            testCase.verifyError(@() rk4(@(t, u) L*u, tspan, dt, u0, ...
+                'SaveEach', 10), 'MATLAB:unrecognizedStringChoice');
+            testCase.verifyError(@() rk4(@(t, u) L*u, tspan, dt, u0, ...
+                'SaveEvery'), 'rk4:options');
+        end
+    end
+end
+
+function observe(store, u)
+    store(store.Count + 1) = u;
+end